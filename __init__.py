@@ -23,6 +23,7 @@ import voluptuous as vol
 
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_CALL_SERVICE, EVENT_HOMEASSISTANT_STOP
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
@@ -102,7 +103,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if stage1 and hasattr(stage1, 'has') and stage1.has("semantic_cache"):
         cache = stage1.get("semantic_cache")
         hass.async_create_task(cache.async_startup())
+        # Flush pending writes before a reload's new cache instance takes over the file,
+        # and unsubscribe so a reloaded entry does not keep the old cache alive
+        entry.async_on_unload(cache.async_shutdown)
+        entry.async_on_unload(
+            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, cache.async_shutdown)
+        )
     
+    # Learned aliases/facts are saved with a delay; write them before a reload re-reads the file
+    from .capabilities.knowledge_graph import KnowledgeGraphCapability
+    entry.async_on_unload(KnowledgeGraphCapability.async_flush_all)
+
+    # Timebox/delay script fields are cached; re-read them after scripts are reloaded
+    from .capabilities.intent_executor import IntentExecutorCapability
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            EVENT_CALL_SERVICE,
+            IntentExecutorCapability.async_clear_script_fields,
+            event_filter=IntentExecutorCapability.is_script_reload,
+        )
+    )
+
     entry.async_on_unload(entry.add_update_listener(update_listener))
     
     _LOGGER.info("Multi-Stage Assist agent registered")
@@ -72,12 +72,13 @@ class BaseStage(ABC):
     async def use(self, name: str, user_input, **kwargs) -> Any:
         """Use a capability and return its result."""
         cap = self.get(name)
-        _LOGGER.debug(
-            "[%s] Using capability '%s' with kwargs=%s",
-            self.name,
-            name,
-            list(kwargs.keys()),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "[%s] Using capability '%s' with kwargs=%s",
+                self.name,
+                name,
+                list(kwargs.keys()),
+            )
         result = await cap.run(user_input, **kwargs)
         _LOGGER.debug("[%s] Capability '%s' returned: %s", self.name, name, result)
         return result
@@ -39,11 +39,12 @@ class Capability:
 
         executor = PromptExecutor(self.config)
         try:
-            _LOGGER.debug(
-                "[Capability:%s] Executing prompt with vars=%s",
-                self.name,
-                list(variables.keys()),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "[Capability:%s] Executing prompt with vars=%s",
+                    self.name,
+                    list(variables.keys()),
+                )
             data = await executor.run(prompt_def, variables, temperature=temperature)
             _LOGGER.debug("[Capability:%s] Prompt result=%s", self.name, data)
             return data
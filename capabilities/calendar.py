@@ -146,7 +146,7 @@ Today's date for reference: {today}
             if result and isinstance(result, dict):
                 return result
         except Exception as e:
-            _LOGGER.debug(f"Failed to extract event details: {e}")
+            _LOGGER.debug("Failed to extract event details: %s", e)
         return None
     
     # Generic titles that should prompt for a real title
@@ -412,7 +412,7 @@ Today's date for reference: {today}
                 "result": await make_response(CALENDAR_MESSAGES["created_success"].format(summary=summary), user_input),
             }
         except Exception as e:
-            _LOGGER.error(f"Failed to create calendar event: {e}")
+            _LOGGER.error("Failed to create calendar event: %s", e)
             return {
                 "status": "handled",
                 "result": await make_response(CALENDAR_MESSAGES["creation_failed"].format(error=str(e)), user_input),
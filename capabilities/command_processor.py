@@ -213,10 +213,11 @@ class CommandProcessorCapability(Capability):
             user_input, intent_name=intent_name, entity_ids=entity_ids, params=params
         )
 
-        _LOGGER.debug(
-            "[CommandProcessor] IntentExecutor returned: %s",
-            {k: v for k, v in (exec_data or {}).items() if k != "result"}
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "[CommandProcessor] IntentExecutor returned: %s",
+                {k: v for k, v in (exec_data or {}).items() if k != "result"}
+            )
 
         if not exec_data or "result" not in exec_data:
             _LOGGER.error(
@@ -8,6 +8,7 @@ Resolves entities from NLU slots using:
 - Capability filtering (e.g., dimmability)
 """
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -94,19 +95,23 @@ class EntityResolverCapability(Capability):
         floor_hint = self._first_str(slots, "floor", "level")
 
         # === Area/Floor Resolution (delegated to AreaResolver) ===
+        # We use the area_resolver to get the canonical match (checks memory, fuzzy, etc.).
+        # Area and floor are independent and may each fall back to the LLM, so overlap them.
+        area_res, floor_res = await asyncio.gather(
+            self._resolve_location(user_input, area_hint, "area"),
+            self._resolve_location(user_input, floor_hint, "floor"),
+        )
+
         area_obj = None
         if area_hint:
-            # We use the area_resolver to get the canonical match (checks memory, fuzzy, etc.)
-            res = await self._area_resolver.run(user_input, area_name=area_hint, mode="area")
-            match_name = res.get("match")
+            match_name = area_res.get("match")
             if match_name:
                 area_obj = self._area_resolver.find_area(match_name)
                 _LOGGER.debug("[EntityResolver] Resolved area: '%s' → '%s'", area_hint, match_name)
 
         floor_obj = None
         if floor_hint:
-            res = await self._area_resolver.run(user_input, area_name=floor_hint, mode="floor")
-            match_name = res.get("match")
+            match_name = floor_res.get("match")
             if match_name:
                 floor_obj = self._area_resolver.find_floor(match_name)
                 _LOGGER.debug("[EntityResolver] Resolved floor: '%s' → '%s'", floor_hint, match_name)
@@ -157,8 +162,10 @@ class EntityResolverCapability(Capability):
         if thing_name:
             all_entities = self._all_entities()
             exact = self._collect_by_name_exact(hass, thing_name, domain, all_entities)
-            if area_entities:
-                exact = [e for e in exact if e in set(area_entities)]
+            # Build the area filter once; it serves the exact and fuzzy tiers
+            allowed = set(area_entities) if area_entities else None
+            if allowed:
+                exact = [e for e in exact if e in allowed]
 
             for eid in exact:
                 if eid not in seen:
@@ -166,7 +173,6 @@ class EntityResolverCapability(Capability):
                     seen.add(eid)
 
             fuzz = await get_fuzz()
-            allowed = set(area_entities) if area_entities else None
             fuzzy_added = self._collect_by_name_fuzzy(
                 hass, thing_name, domain, fuzz, all_entities, allowed=allowed
             )
@@ -330,6 +336,14 @@ class EntityResolverCapability(Capability):
                 return v.strip()
         return None
 
+    async def _resolve_location(
+        self, user_input, hint: Optional[str], mode: str
+    ) -> Dict[str, Any]:
+        """Resolve an area or floor hint via the AreaResolver ({} if no hint)."""
+        if not hint:
+            return {}
+        return await self._area_resolver.run(user_input, area_name=hint, mode=mode)
+
     def _state_exists(self, entity_id: str) -> bool:
         return self.hass.states.get(entity_id) is not None
 
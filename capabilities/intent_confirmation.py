@@ -23,6 +23,16 @@ class IntentConfirmationCapability(Capability):
     name = "intent_confirmation"
     description = "Generate natural, context-aware German confirmation messages for successful actions. Uses randomized templates to ensure variety. Handles state queries, multi-entity summaries, and specific parameter confirmations (e.g., temperatures, brightness levels) without LLM dependency for performance."
 
+    # Intents whose (action, value) does not depend on params
+    _FIXED_ACTIONS = {
+        # State queries - special marker to use build_state_response
+        "HassGetState": ("_state_query", None),
+        "HassTurnOn": ("toggle", "on"),
+        "HassTurnOff": ("toggle", "off"),
+        "HassTimerCancel": ("timer_cancelled", None),
+        "DelayedControl": ("toggle", "on"),
+    }
+
     async def run(
         self,
         user_input,
@@ -39,15 +49,17 @@ class IntentConfirmationCapability(Capability):
         domains = []
         states = []
 
+        states_get = self.hass.states.get
         for eid in entity_ids:
-            st = self.hass.states.get(eid)
+            st = states_get(eid)
+            domain, dot, _ = eid.partition(".")
             if st:
                 names.append(st.attributes.get("friendly_name") or eid)
-                domains.append(eid.split(".")[0])
+                domains.append(domain)
                 states.append(st.state)
             else:
                 names.append(eid)
-                domains.append(eid.split(".")[0] if "." in eid else "")
+                domains.append(domain if dot else "")
                 states.append("unknown")
 
         primary_domain = domains[0] if domains else "default"
@@ -92,16 +104,9 @@ class IntentConfirmationCapability(Capability):
         states: List[str],
     ) -> tuple:
         """Determine action type and value based on intent and params."""
-        
-        # State queries - return special marker to use build_state_response
-        if intent_name == "HassGetState":
-            return ("_state_query", None)  # Special marker
-
-        
-        # On/Off toggle
-        if intent_name in ("HassTurnOn", "HassTurnOff"):
-            state = "on" if intent_name == "HassTurnOn" else "off"
-            return ("toggle", state)
+        fixed = self._FIXED_ACTIONS.get(intent_name)
+        if fixed is not None:
+            return fixed
         
         # Light brightness
         if intent_name == "HassLightSet":
@@ -138,8 +143,6 @@ class IntentConfirmationCapability(Capability):
         if intent_name == "HassTimerSet":
             duration = params.get("duration")
             return ("timer_set", duration)
-        if intent_name == "HassTimerCancel":
-            return ("timer_cancelled", None)
             
         # Vacuum
         if intent_name == "HassVacuumStart":
@@ -153,9 +156,6 @@ class IntentConfirmationCapability(Capability):
             command = params.get("command", "on")
             action = "temporary_on" if command == "on" else "temporary_off"
             return (action, params.get("duration"))
-            
-        if intent_name == "DelayedControl":
-            return ("toggle", "on")
         
         # Default fallback
         return ("toggle", "on")
@@ -1,9 +1,14 @@
 import asyncio
 import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from homeassistant.helpers import intent as ha_intent
-from homeassistant.core import Context
+from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.core import Context, callback
 from homeassistant.components.conversation import ConversationResult
 
 from ..conversation_utils import (
@@ -15,7 +20,6 @@ from ..utils.response_builder import build_confirmation
 from ..constants.entity_keywords import FRACTION_VALUES, DOMAIN_NAMES_PLURAL
 from ..constants.messages_de import (
     ERROR_MESSAGES, 
-    SYSTEM_MESSAGES,
     COMMAND_STATE_MAP,
     OPPOSITE_STATE_MAP,
     DURATION_TEMPLATES,
@@ -29,6 +33,53 @@ from .base import Capability
 
 _LOGGER = logging.getLogger(__name__)
 
+# 'command' slot values that mean "switch on" (English from the LLM, German from NLU)
+_ON_COMMANDS = frozenset({"on", *(k for k, v in COMMAND_STATE_MAP.items() if v == "on")})
+
+# States that make an entity unusable as an execution target
+_UNAVAILABLE_STATES = frozenset({"unavailable", "unknown"})
+
+# Relative adjustment commands for light brightness and cover position
+_STEP_COMMANDS = frozenset({"step_up", "step_down"})
+
+# Intents whose answer is a spoken state report
+_STATE_QUERY_INTENTS = frozenset({"HassGetState", "HassClimateGetTemperature"})
+
+# Intents that may be routed to the timebox/delay scripts
+_SCRIPT_INTENTS = frozenset({"TemporaryControl", "HassTurnOn", "HassTurnOff", "DelayedControl"})
+
+# Queried state word (English or German) -> HA states that satisfy it
+_QUERY_STATE_ALIASES: Dict[str, List[str]] = {
+    "closed": ["closed"], "geschlossen": ["closed"],
+    "open": ["open"], "offen": ["open"],
+    "on": ["on"], "an": ["on"],
+    "off": ["off"], "aus": ["off"],
+}
+
+
+@lru_cache(maxsize=2048)
+def _entity_domain(entity_id: str) -> str:
+    """Return the domain part of an entity ID (cached, IDs repeat across runs)."""
+    return entity_id.partition(".")[0]
+
+
+@dataclass
+class _EntityRun:
+    """State shared by the concurrent per-entity dispatches of one run()."""
+    user_input: Any
+    intent_name: str
+    params: Dict[str, Any]  # Normalized once, read-only for all entities
+    duration: tuple[int, int]  # (minutes, seconds) parsed once from params
+    language: str
+    context: Context
+    shared_slots: Dict[str, Dict[str, Any]]
+    domain_slots: Dict[str, Dict[str, Any]]
+    # Written by the dispatches; they all run on the event loop, so no locking
+    executed_params: Dict[str, Any]
+    script_batch: Dict[tuple, List[str]] = field(default_factory=lambda: defaultdict(list))
+    # (entity_id, intent, expected_state, expected_brightness), polled after the scripts start
+    verifications: List[tuple] = field(default_factory=list)
+
 
 class IntentExecutorCapability(Capability):
     """Execute a known HA intent for one or more concrete entity_ids."""
@@ -36,11 +87,14 @@ class IntentExecutorCapability(Capability):
     name = "intent_executor"
     description = "Execute concrete Home Assistant intents for specific entities. Features: 1. Automatic Knowledge Graph prerequisite resolution 2. Parameter normalization (German fractions to integers) 3. Relative step adjustments (brightness/cover) 4. Advanced timebox/delay support via specialized scripts 5. State-query filtering and 6. Post-execution verification."
 
-    RESOLUTION_KEYS = {"area", "floor", "name", "entity_id"}
+    RESOLUTION_KEYS = frozenset({"area", "floor", "name", "entity_id"})
     BRIGHTNESS_STEP = 35  # Percentage of current brightness for step_up/step_down
     COVER_STEP = 25       # Percentage for cover step_up/step_down (0=closed, 100=open)
     TIMEBOX_SCRIPT_ENTITY_ID = "script.timebox_entity_state"
     DELAY_SCRIPT_ENTITY_ID = "script.delay_action"
+    MAX_PARALLEL_ENTITIES = 8  # Concurrent per-entity intent dispatches
+    # Script name -> installed copy declares target_entities; shared by all instances
+    _script_list_support: Dict[str, bool] = {}
 
     def _extract_duration(self, params: Dict[str, Any]) -> tuple[int, int]:
         """Extract minutes and seconds from params. Returns (minutes, seconds)."""
@@ -80,14 +134,131 @@ class IntentExecutorCapability(Capability):
                                 pass
         return normalized
 
+    @staticmethod
+    def _plain_speech(resp) -> str:
+        """Return the plain speech text of an IntentResponse ("" if unset)."""
+        speech = resp.speech
+        if not speech or not isinstance(speech, dict):
+            return ""
+        return speech.get("plain", {}).get("speech") or ""
+
+    @staticmethod
+    def _conversation_result(user_input, resp) -> ConversationResult:
+        """Wrap an intent response as a final (non-continuing) conversation result."""
+        return ConversationResult(
+            response=resp,
+            conversation_id=user_input.conversation_id,
+            continue_conversation=False,
+        )
+
+    @staticmethod
+    def _raise_if_fatal(error: BaseException) -> None:
+        """Re-raise a gathered dispatch error that must not be swallowed.
+
+        A CancelledError only ends one entity's dispatch unless run() itself is
+        being cancelled; other non-Exception errors (SystemExit, ...) always propagate.
+        """
+        if isinstance(error, asyncio.CancelledError):
+            task = asyncio.current_task()
+            if task is not None and task.cancelling():
+                raise error
+        elif not isinstance(error, Exception):
+            raise error
+
     def _check_script_exists(self, script_entity_id: str) -> bool:
         """Check if a script entity exists in Home Assistant."""
         state = self.hass.states.get(script_entity_id)
         return state is not None
 
+    async def _script_accepts_entity_list(self, script_name: str) -> bool:
+        """Check whether the installed script declares the target_entities field.
+
+        Copies installed before batching only take a single target_entity, and
+        the non-blocking script call cannot report that they failed. Answers are
+        cached per script until scripts are reloaded; failed lookups are retried.
+        """
+        cached = self._script_list_support.get(script_name)
+        if cached is not None:
+            return cached
+        try:
+            descriptions = await async_get_all_descriptions(self.hass)
+        except Exception as e:
+            _LOGGER.debug("[IntentExecutor] Could not read script fields: %s", e)
+            return False
+        fields = descriptions.get("script", {}).get(script_name, {}).get("fields", {})
+        accepts = "target_entities" in fields
+        self._script_list_support[script_name] = accepts
+        return accepts
+
+    @staticmethod
+    @callback
+    def is_script_reload(event) -> bool:
+        """Event filter: match only script.reload service calls."""
+        # Older HA passes the event to filters, newer versions pass its data
+        data = getattr(event, "data", event)
+        return data.get("domain") == "script" and data.get("service") == "reload"
+
+    @classmethod
+    @callback
+    def async_clear_script_fields(cls, _event) -> None:
+        """Forget cached script fields after a script reload."""
+        cls._script_list_support.clear()
+
+    async def _call_entity_script(
+        self,
+        script_entity_id: str,
+        entity_ids: List[str],
+        minutes: int,
+        seconds: int,
+        value: int = None,
+        action: str = None,
+    ) -> bool:
+        """Start one run of a timebox/delay script for all entity_ids.
+
+        Older installs without target_entities get one run per entity instead.
+        Returns True on success, False on failure.
+        """
+        script_name = script_entity_id.partition(".")[2]
+        if len(entity_ids) == 1:
+            data = {"target_entity": entity_ids[0]}
+        elif await self._script_accepts_entity_list(script_name):
+            data = {"target_entities": list(entity_ids)}
+        else:
+            _LOGGER.warning(
+                "[IntentExecutor] Installed '%s' predates target_entities, calling it per entity. "
+                "Update it from: multistage_assist/scripts/%s.yaml",
+                script_entity_id,
+                script_name,
+            )
+            results = [
+                await self._call_entity_script(
+                    script_entity_id, [eid], minutes, seconds, value, action
+                )
+                for eid in entity_ids
+            ]
+            return all(results)
+        data.update(minutes=minutes, seconds=seconds)
+        if value is not None:
+            data["value"] = value
+        if action is not None:
+            data["action"] = action
+
+        try:
+            # Fire-and-forget - don't wait for the script to complete
+            # (script waits for the duration/delay before acting)
+            await self.hass.services.async_call(
+                "script", script_name, data, blocking=False
+            )
+            return True
+        except Exception as e:
+            _LOGGER.error(
+                "[IntentExecutor] Script '%s' failed for %s: %s", script_name, entity_ids, e
+            )
+            return False
+
     async def _call_timebox_script(
         self,
-        entity_id: str,
+        entity_ids: List[str],
         minutes: int,
         seconds: int,
         value: int = None,
@@ -108,34 +279,19 @@ class IntentExecutorCapability(Capability):
         
         _LOGGER.debug(
             "[IntentExecutor] Calling timebox script for %s: value=%s, action=%s, duration=%dm%ds",
-            entity_id,
+            entity_ids,
             value,
             action,
             minutes,
             seconds,
         )
-        data = {"target_entity": entity_id, "minutes": minutes, "seconds": seconds}
-        if value is not None:
-            data["value"] = value
-        if action is not None:
-            data["action"] = action
-
-        try:
-            # Fire-and-forget - don't wait for the script to complete
-            # (script waits for duration before reverting)
-            await self.hass.services.async_call(
-                "script", "timebox_entity_state", data, blocking=False
-            )
-            return True
-        except Exception as e:
-            _LOGGER.error(
-                "[IntentExecutor] Timebox script failed for %s: %s", entity_id, e
-            )
-            return False
+        return await self._call_entity_script(
+            self.TIMEBOX_SCRIPT_ENTITY_ID, entity_ids, minutes, seconds, value, action
+        )
 
     async def _call_delay_script(
         self,
-        entity_id: str,
+        entity_ids: List[str],
         minutes: int,
         seconds: int,
         value: int = None,
@@ -156,28 +312,15 @@ class IntentExecutorCapability(Capability):
         
         _LOGGER.debug(
             "[IntentExecutor] Calling delay script for %s: value=%s, action=%s, delay=%dm%ds",
-            entity_id,
+            entity_ids,
             value,
             action,
             minutes,
             seconds,
         )
-        data = {"target_entity": entity_id, "minutes": minutes, "seconds": seconds}
-        if value is not None:
-            data["value"] = value
-        if action is not None:
-            data["action"] = action
-
-        try:
-            await self.hass.services.async_call(
-                "script", "delay_action", data, blocking=False
-            )
-            return True
-        except Exception as e:
-            _LOGGER.error(
-                "[IntentExecutor] Delay script failed for %s: %s", entity_id, e
-            )
-            return False
+        return await self._call_entity_script(
+            self.DELAY_SCRIPT_ENTITY_ID, entity_ids, minutes, seconds, value, action
+        )
 
     def _parse_delay_or_time(self, delay_str: str) -> tuple[int, int]:
         """Parse delay string ('10 Minuten') or time string ('15:30', '15 Uhr').
@@ -221,10 +364,11 @@ class IntentExecutorCapability(Capability):
         delta = target - now
         total_seconds = int(delta.total_seconds())
         
-        _LOGGER.debug(
-            "[IntentExecutor] Parsed time '%s' -> target %s, delay=%d seconds",
-            delay_str, target.strftime("%H:%M"), total_seconds
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "[IntentExecutor] Parsed time '%s' -> target %s, delay=%d seconds",
+                delay_str, target.strftime("%H:%M"), total_seconds
+            )
         
         return (total_seconds // 60, total_seconds % 60)
     
@@ -284,7 +428,7 @@ class IntentExecutorCapability(Capability):
                 )
                 
                 try:
-                    domain = prereq_id.split(".")[0]
+                    domain = _entity_domain(prereq_id)
                     await self.hass.services.async_call(
                         domain,
                         prereq_action,
@@ -305,9 +449,6 @@ class IntentExecutorCapability(Capability):
         
         # Small delay to allow devices to come online, with smart waiting
         if executed_prerequisites:
-            import asyncio
-            import time
-            
             # Wait for up to 5 seconds for prerequisites to reach target state
             start_time = time.time()
             pending_checks = list(executed_prerequisites)
@@ -340,44 +481,44 @@ class IntentExecutorCapability(Capability):
                 pending_checks = still_pending
                 await asyncio.sleep(0.5)
             
-            _LOGGER.debug(
-                "[IntentExecutor] Executed %d prerequisites: %s (Wait time: %.2fs)",
-                len(executed_prerequisites),
-                [p["entity_id"] for p in executed_prerequisites],
-                time.time() - start_time
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "[IntentExecutor] Executed %d prerequisites: %s (Wait time: %.2fs)",
+                    len(executed_prerequisites),
+                    [p["entity_id"] for p in executed_prerequisites],
+                    time.time() - start_time
+                )
         
         return executed_prerequisites
 
 
-    async def _handle_timebox_or_delay(
-        self, intent_name, eid, current_params, language, timebox_failures
+    def _handle_timebox_or_delay(
+        self, intent_name, eid, state_obj, current_params, duration, language,
+        script_batch,
     ) -> Optional[tuple]:
         """Handle TemporaryControl, TurnOn/Off with duration, and DelayedControl.
         
+        Timebox and delay requests are queued in script_batch and sent by run().
+        
         Returns (effective_intent, response) tuple if handled (continue to next eid),
         or (effective_intent, None) if intent was converted but not yet handled,
         or None if not applicable.
         """
-        hass = self.hass
-        minutes, seconds = self._extract_duration(current_params)
+        minutes, seconds = duration
 
         if intent_name == "TemporaryControl":
             command = current_params.get("command", "on")
-            action = COMMAND_STATE_MAP.get(command, "off")
+            action = "on" if command in _ON_COMMANDS else "off"
 
             if minutes > 0 or seconds > 0:
-                success = await self._call_timebox_script(eid, minutes, seconds, action=action)
-                if not success:
-                    timebox_failures.append(eid)
+                script_batch[(self.TIMEBOX_SCRIPT_ENTITY_ID, minutes, seconds, None, action)].append(eid)
                 _LOGGER.debug(
-                    "[IntentExecutor] Timebox %s on %s for %dm%ds (success=%s)",
-                    action, eid, minutes, seconds, success
+                    "[IntentExecutor] Timebox %s on %s for %dm%ds queued",
+                    action, eid, minutes, seconds
                 )
                 resp = ha_intent.IntentResponse(language=language)
                 resp.response_type = ha_intent.IntentResponseType.ACTION_DONE
 
-                state_obj = hass.states.get(eid)
                 name = state_obj.attributes.get("friendly_name", eid) if state_obj else eid
 
                 action_de = ACTION_VERBS.get(action, action)
@@ -398,14 +539,11 @@ class IntentExecutorCapability(Capability):
 
         elif (intent_name in ("HassTurnOn", "HassTurnOff")) and (minutes > 0 or seconds > 0):
             action = "on" if intent_name == "HassTurnOn" else "off"
-            success = await self._call_timebox_script(eid, minutes, seconds, action=action)
-            if not success:
-                timebox_failures.append(eid)
+            script_batch[(self.TIMEBOX_SCRIPT_ENTITY_ID, minutes, seconds, None, action)].append(eid)
 
             resp = ha_intent.IntentResponse(language=language)
             resp.response_type = ha_intent.IntentResponseType.ACTION_DONE
 
-            state_obj = hass.states.get(eid)
             name = state_obj.attributes.get("friendly_name", eid) if state_obj else eid
             action_de = ACTION_VERBS.get(action, action)
 
@@ -424,26 +562,22 @@ class IntentExecutorCapability(Capability):
         elif intent_name == "DelayedControl":
             delay_str = current_params.get("delay", "")
             command = current_params.get("command", "on")
-            action = COMMAND_STATE_MAP.get(command, "off")
+            action = "on" if command in _ON_COMMANDS else "off"
 
             delay_minutes, delay_seconds = self._parse_delay_or_time(delay_str)
 
             if delay_minutes > 0 or delay_seconds > 0:
-                success = await self._call_delay_script(
-                    eid, delay_minutes, delay_seconds, action=action
-                )
-                if not success:
-                    timebox_failures.append(eid)
-
+                script_batch[
+                    (self.DELAY_SCRIPT_ENTITY_ID, delay_minutes, delay_seconds, None, action)
+                ].append(eid)
                 _LOGGER.debug(
-                    "[IntentExecutor] DelayedControl %s on %s in %dm%ds (success=%s)",
-                    action, eid, delay_minutes, delay_seconds, success
+                    "[IntentExecutor] DelayedControl %s on %s in %dm%ds queued",
+                    action, eid, delay_minutes, delay_seconds
                 )
 
                 resp = ha_intent.IntentResponse(language=language)
                 resp.response_type = ha_intent.IntentResponseType.ACTION_DONE
 
-                state_obj = hass.states.get(eid)
                 name = state_obj.attributes.get("friendly_name", eid) if state_obj else eid
 
                 action_de = ACTION_VERBS.get(action, action)
@@ -465,29 +599,25 @@ class IntentExecutorCapability(Capability):
         return None
 
     def _handle_light_step(
-        self, eid, current_params, final_executed_params
+        self, eid, state_obj, val, current_params, final_executed_params
     ) -> Optional[str]:
         """Handle light brightness step_up/step_down adjustments.
         
+        `val` is the brightness value (from the 'brightness' or 'command' slot).
         Modifies current_params and final_executed_params in place.
         Returns new effective_intent if changed (e.g. HassTurnOn for off lights), else None.
         """
-        brightness_val = current_params.get("brightness") or current_params.get("command")
-        if not brightness_val:
-            return None
-        
-        val = brightness_val
-        if val not in ("step_up", "step_down"):
+        if val not in _STEP_COMMANDS:
             return None
 
-        state_obj = self.hass.states.get(eid)
         if not state_obj:
-            current_params.pop("brightness", None)
-            current_params.pop("command", None)
+            # Unknown current brightness: drop the step so HA gets no bogus value
+            for key in ("brightness", "command"):
+                current_params.pop(key, None)
             return None
 
-        cur_255 = state_obj.attributes.get("brightness") or 0
-        cur_pct = int((cur_255 / 255.0) * 100)
+        cur_255 = int(state_obj.attributes.get("brightness") or 0)
+        cur_pct = cur_255 * 100 // 255
         light_is_off = state_obj.state == "off" or cur_pct == 0
         new_effective = None
 
@@ -500,10 +630,10 @@ class IntentExecutorCapability(Capability):
                     eid, new_pct
                 )
             else:
-                change = max(10, int(cur_pct * self.BRIGHTNESS_STEP / 100))
+                change = max(10, cur_pct * self.BRIGHTNESS_STEP // 100)
                 new_pct = min(100, cur_pct + change)
         else:
-            change = max(10, int(cur_pct * self.BRIGHTNESS_STEP / 100))
+            change = max(10, cur_pct * self.BRIGHTNESS_STEP // 100)
             new_pct = max(0, cur_pct - change)
 
         current_params["brightness"] = new_pct
@@ -519,17 +649,16 @@ class IntentExecutorCapability(Capability):
         return new_effective
 
     def _handle_cover_step(
-        self, eid, current_params, final_executed_params
+        self, eid, state_obj, current_params, final_executed_params
     ) -> None:
         """Handle cover step_up/step_down position adjustments.
         
         Modifies current_params and final_executed_params in place.
         """
         cmd = current_params.get("command")
-        if cmd not in ("step_up", "step_down"):
+        if cmd not in _STEP_COMMANDS:
             return
 
-        state_obj = self.hass.states.get(eid)
         if state_obj:
             cur_pos = state_obj.attributes.get("current_position", 0) or 0
 
@@ -557,26 +686,24 @@ class IntentExecutorCapability(Capability):
             current_params.pop("command", None)
 
     def _build_state_query_speech(
-        self, user_input, results, entity_ids, all_entity_ids, params, language
+        self, user_input, result_eids, entity_ids, all_entity_ids, params, language, state_map
     ) -> Optional[str]:
         """Build speech text for HassGetState / HassClimateGetTemperature queries.
         
         Returns speech text string, or None if default speech is adequate.
         """
-        hass = self.hass
-        
         # Collect entity data
         names = []
         states = []
-        for eid, _ in results:
-            state_obj = hass.states.get(eid)
+        for eid in result_eids:
+            state_obj = state_map.get(eid)
             if not state_obj:
                 continue
             friendly = state_obj.attributes.get("friendly_name", eid)
             names.append(friendly)
             states.append(state_obj.state)
 
-        domain = entity_ids[0].split(".")[0] if entity_ids else None
+        domain = _entity_domain(entity_ids[0]) if entity_ids else None
 
         user_text = user_input.text.lower()
         query_state = params.get("state", "").lower()
@@ -588,13 +715,7 @@ class IntentExecutorCapability(Capability):
 
         from ..utils.response_builder import STATE_DESCRIPTIONS_DE, build_state_response
 
-        state_map = {
-            "closed": ["closed"], "geschlossen": ["closed"],
-            "open": ["open"], "offen": ["open"],
-            "on": ["on"], "an": ["on"],
-            "off": ["off"], "aus": ["off"],
-        }
-        expected_states = state_map.get(query_state, [query_state]) if query_state else []
+        expected_states = _QUERY_STATE_ALIASES.get(query_state, [query_state]) if query_state else []
 
         domain_states = STATE_DESCRIPTIONS_DE.get(domain, {})
         positive_word = domain_states.get(expected_states[0], query_state) if expected_states else ""
@@ -617,16 +738,12 @@ class IntentExecutorCapability(Capability):
                 return _get_state_response("states_are", devices=str(len(names)), state=positive_word)
 
         elif is_all_question and query_state:
-            all_names = []
-            all_states = []
+            # One pass over the cached states; only the exceptions need names
+            not_matching = []
             for eid in all_entity_ids:
-                state_obj = hass.states.get(eid)
-                if state_obj:
-                    all_names.append(state_obj.attributes.get("friendly_name", eid))
-                    all_states.append(state_obj.state)
-
-            matching = [n for n, s in zip(all_names, all_states) if s in expected_states]
-            not_matching = [n for n, s in zip(all_names, all_states) if s not in expected_states]
+                state_obj = state_map[eid]
+                if state_obj.state not in expected_states:
+                    not_matching.append(state_obj.attributes.get("friendly_name", eid))
 
             if not not_matching:
                 return CONFIRMATION_TEMPLATES["state_all_yes"].format(state=positive_word)
@@ -646,7 +763,7 @@ class IntentExecutorCapability(Capability):
                     )
 
         elif query_state and len(all_entity_ids) == 1:
-            entity_state = states[0] if states else hass.states.get(all_entity_ids[0]).state
+            entity_state = states[0] if states else state_map[all_entity_ids[0]].state
             entity_name = names[0] if names else all_entity_ids[0].split(".")[-1]
 
             if entity_state in expected_states:
@@ -661,6 +778,190 @@ class IntentExecutorCapability(Capability):
         else:
             return build_state_response(names, states, domain)
 
+    @classmethod
+    def _build_shared_slots(cls, params: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Build the intent slots that are identical for every entity."""
+        return {
+            k: {"value": v}
+            for k, v in params.items()
+            # Skip empty string values - they cause HA intent validation errors
+            if k not in cls.RESOLUTION_KEYS and v != "" and v is not None
+        }
+
+    async def _handle_entity(
+        self, entity_run: _EntityRun, eid: str, domain: str, state_obj, bucket_intent: str
+    ) -> Optional[tuple]:
+        """Execute the intent for a single entity.
+
+        `domain` and `bucket_intent` (the intent after per-domain overrides) are
+        looked up for the entity's domain in run(). Timebox and delay requests are
+        queued in `entity_run.script_batch` keyed by (script, minutes, seconds,
+        value, action), and state checks in `entity_run.verifications`; run()
+        sends the scripts first and then polls the checks.
+        Returns (effective_intent, response) tuple, or None if execution failed.
+        """
+        hass = self.hass
+        intent_name = entity_run.intent_name
+        params = entity_run.params
+        duration = entity_run.duration
+        language = entity_run.language
+        # --- 1. SENSOR LOGIC: decided once per domain in run() ---
+        effective_intent = bucket_intent
+        # Params are normalized once in run() and shared by all entities;
+        # branches that rewrite values per entity copy them first.
+        current_params = params
+
+        # --- 2. TIMEBOX / DELAY: TemporaryControl, TurnOn/Off+duration, DelayedControl ---
+        if intent_name in _SCRIPT_INTENTS:
+            tb_result = self._handle_timebox_or_delay(
+                intent_name, eid, state_obj, current_params, duration, language,
+                entity_run.script_batch,
+            )
+            if tb_result is not None:
+                effective_intent, resp = tb_result
+                if resp is not None:
+                    return (effective_intent, resp)
+
+        # --- 3. LIGHT LOGIC ---
+        # Handle brightness from either 'brightness' or 'command' slot.
+        # Only a missing/empty brightness falls back: 0 is a valid absolute value.
+        val = current_params.get("brightness")
+        if val is None or val == "":
+            val = current_params.get("command")
+        
+        if intent_name == "HassLightSet" and val is not None and val != "":
+            # Timebox: if duration specified and absolute brightness
+            minutes, seconds = duration
+            if (minutes > 0 or seconds > 0) and isinstance(val, int):
+                # Timebox with brightness value
+                entity_run.script_batch[(self.TIMEBOX_SCRIPT_ENTITY_ID, minutes, seconds, val, None)].append(eid)
+
+                # Create fake response
+                resp = ha_intent.IntentResponse(language=language)
+                resp.response_type = ha_intent.IntentResponseType.ACTION_DONE
+                return (effective_intent, resp)
+
+            # Step up/down logic (RELATIVE brightness adjustments)
+            if val in _STEP_COMMANDS:
+                current_params = dict(current_params)
+                new_intent = self._handle_light_step(
+                    eid, state_obj, val, current_params, entity_run.executed_params
+                )
+                if new_intent:
+                    effective_intent = new_intent
+
+        # --- 4. COVER: Step up/down logic (RELATIVE position adjustments) ---
+        if (
+            effective_intent == "HassSetPosition"
+            and current_params.get("command") in _STEP_COMMANDS
+        ):
+            current_params = dict(current_params)
+            self._handle_cover_step(eid, state_obj, current_params, entity_run.executed_params)
+
+        # --- 5. TIMEBOX: Cover/Fan/Climate intents ---
+        minutes, seconds = duration
+        if minutes > 0 or seconds > 0:
+            value_param = None
+            value = None
+
+            # Determine which parameter contains the value
+            if "position" in current_params:  # Cover
+                value_param = "position"
+                value = current_params["position"]
+            elif "percentage" in current_params:  # Fan
+                value_param = "percentage"
+                value = current_params["percentage"]
+            elif "temperature" in current_params:  # Climate
+                value_param = "temperature"
+                value = current_params["temperature"]
+
+            # If we found a value to timebox
+            if value is not None and isinstance(value, (int, float)):
+                entity_run.script_batch[
+                    (self.TIMEBOX_SCRIPT_ENTITY_ID, minutes, seconds, int(value), None)
+                ].append(eid)
+
+                # Create fake response
+                resp = ha_intent.IntentResponse(language=language)
+                resp.response_type = ha_intent.IntentResponseType.ACTION_DONE
+                return (effective_intent, resp)
+
+        # --- 6. TIMER: Handle HassTimerSet directly via service call ---
+        if intent_name == "HassTimerSet":
+            minutes, seconds = duration
+            duration_sec = minutes * 60 + seconds
+            
+            if duration_sec > 0:
+                try:
+                    await hass.services.async_call(
+                        "timer", "start",
+                        {"entity_id": eid, "duration": duration_sec},
+                        blocking=True
+                    )
+                    
+                    resp = ha_intent.IntentResponse(language=language)
+                    resp.response_type = ha_intent.IntentResponseType.ACTION_DONE
+                    
+                    name = state_obj.attributes.get("friendly_name", eid) if state_obj else eid
+                    
+                    speech = build_confirmation(
+                        "HassTimerSet",
+                        [name],
+                        params={"duration": DURATION_TEMPLATES["minutes"].format(minutes=minutes) if minutes > 0 else DURATION_TEMPLATES["seconds"].format(seconds=seconds)}
+                    )
+                    resp.async_set_speech(speech)
+                    return (effective_intent, resp)
+                except Exception as e:
+                    _LOGGER.error("[IntentExecutor] Timer start failed for %s: %s", eid, e)
+                    # Fall through to let standard handler try (or fail)
+
+        # Slots: shared value slots, patched where a step branch rewrote params
+        slots = {"name": {"value": eid}, **entity_run.shared_slots}
+        if current_params is not params:
+            for k in params.keys() - current_params.keys():
+                slots.pop(k, None)
+            for k, v in current_params.items():
+                if params.get(k) is not v and k not in self.RESOLUTION_KEYS and v != "" and v is not None:
+                    slots[k] = {"value": v}
+        if "domain" not in current_params:
+            slots["domain"] = entity_run.domain_slots[domain]
+
+        _LOGGER.debug("[IntentExecutor] Executing %s on %s", effective_intent, eid)
+
+        try:
+            resp = await ha_intent.async_handle(
+                hass,
+                platform="conversation",
+                intent_type=effective_intent,
+                slots=slots,
+                text_input=entity_run.user_input.text,
+                context=entity_run.context,
+                language=language,
+            )
+        except Exception as e:
+            _LOGGER.warning("[IntentExecutor] Error on %s: %s", eid, e)
+            return None
+
+        # Verify execution for certain intents
+        if effective_intent in ("HassTurnOn", "HassTurnOff", "HassLightSet"):
+            expected_state = None
+            expected_brightness = None
+            
+            if effective_intent == "HassTurnOn":
+                expected_state = "on"
+            elif effective_intent == "HassTurnOff":
+                expected_state = "off"
+            elif effective_intent == "HassLightSet":
+                expected_state = "on"  # Light should be on after setting
+                if "brightness" in current_params:
+                    expected_brightness = current_params["brightness"]
+            
+            entity_run.verifications.append(
+                (eid, effective_intent, expected_state, expected_brightness)
+            )
+
+        return (effective_intent, resp)
+
     async def run(
         self,
         user_input,
@@ -674,59 +975,56 @@ class IntentExecutorCapability(Capability):
         if not intent_name or not entity_ids:
             return {}
 
+        # Stringify once here; effective intents are either this or literals
+        intent_name = str(intent_name)
         hass = self.hass
         params = params or {}
 
-        valid_ids = [
-            eid
-            for eid in entity_ids
-            if hass.states.get(eid)
-            and hass.states.get(eid).state not in ("unavailable", "unknown")
-        ]
-        if not valid_ids:
+        # State queries ("Welche Lichter sind an?") only execute on matching entities
+        requested_state = (
+            (params.get("state") or "").lower() if intent_name == "HassGetState" else ""
+        )
+
+        # Single pass: look each entity up once (the cached states are reused below),
+        # drop unavailable ones and filter state queries. all_entity_ids keeps ALL
+        # available entities to answer "Ja, alle sind an" vs "Nein, 4 von 24 sind an".
+        state_map = {}
+        all_entity_ids = []
+        valid_ids = []
+        for eid in entity_ids:
+            st = hass.states.get(eid)
+            if not st or st.state in _UNAVAILABLE_STATES:
+                continue
+            state_map[eid] = st
+            all_entity_ids.append(eid)
+            if not requested_state or st.state.lower() == requested_state:
+                valid_ids.append(eid)
+        if not all_entity_ids:
             return {}
 
         # --- STATE FILTERING for HassGetState queries ---
-        # For "Welche Lichter sind an?" - we need to know about ALL entities
-        # to properly answer "Ja, alle sind an" vs "Nein, 4 von 24 sind an"
-        all_entity_ids = valid_ids.copy()  # Track ALL before filtering
-        
-        if intent_name == "HassGetState" and "state" in params:
-            requested_state = params.get("state", "").lower()
-            if requested_state:
-                # Filter to entities matching the requested state
-                valid_ids = [
-                    eid
-                    for eid in valid_ids
-                    if hass.states.get(eid).state.lower() == requested_state
-                ]
-                _LOGGER.debug(
-                    "[IntentExecutor] Filtered to %d of %d entities with state='%s'",
-                    len(valid_ids),
-                    len(all_entity_ids),
-                    requested_state,
-                )
+        if requested_state:
+            _LOGGER.debug(
+                "[IntentExecutor] Filtered to %d of %d entities with state='%s'",
+                len(valid_ids),
+                len(all_entity_ids),
+                requested_state,
+            )
 
-                # If filtering results in empty list, report that
-                if not valid_ids:
-                    # Domain-specific device names and state words
-                    domain = all_entity_ids[0].split(".")[0] if all_entity_ids else params.get("domain", "")
-                    
-                    from ..utils.response_builder import STATE_DESCRIPTIONS_DE
-                    state_word = STATE_DESCRIPTIONS_DE.get(domain, {}).get(requested_state, requested_state)
-                    
-                    device_name = DOMAIN_NAMES_PLURAL.get(domain, DEFAULT_DEVICE_WORD)
-                    
-                    resp = ha_intent.IntentResponse(language=language)
-                    resp.response_type = ha_intent.IntentResponseType.ACTION_DONE
-                    resp.async_set_speech(get_state_response("none_match", device=device_name, state=state_word))
-                    return {
-                        "result": ConversationResult(
-                            response=resp,
-                            conversation_id=user_input.conversation_id,
-                            continue_conversation=False,
-                        )
-                    }
+            # If filtering results in empty list, report that
+            if not valid_ids:
+                # Domain-specific device names and state words
+                domain = _entity_domain(all_entity_ids[0])
+                
+                from ..utils.response_builder import STATE_DESCRIPTIONS_DE
+                state_word = STATE_DESCRIPTIONS_DE.get(domain, {}).get(requested_state, requested_state)
+                
+                device_name = DOMAIN_NAMES_PLURAL.get(domain, DEFAULT_DEVICE_WORD)
+                
+                resp = ha_intent.IntentResponse(language=language)
+                resp.response_type = ha_intent.IntentResponseType.ACTION_DONE
+                resp.async_set_speech(get_state_response("none_match", device=device_name, state=state_word))
+                return {"result": self._conversation_result(user_input, resp)}
 
         # --- PHASE 2: Resolve Knowledge Graph Prerequisites ---
         # Handle power dependencies (AUTO mode) before executing main intent
@@ -736,176 +1034,122 @@ class IntentExecutorCapability(Capability):
                 valid_ids, intent_name
             )
 
-        results: List[tuple[str, ha_intent.IntentResponse]] = []
+        # Executed entities and their responses, kept as parallel lists
+        result_eids: List[str] = []
+        result_resps: List[ha_intent.IntentResponse] = []
         final_executed_params = params.copy()
         final_executed_params["_prerequisites"] = executed_prerequisites  # For confirmation
         timebox_failures: List[str] = []  # Track failed timebox calls
-        verification_failures: List[str] = []  # Track entities that failed verification
-
-        for eid in valid_ids:
-            effective_intent = intent_name
-            domain = eid.split(".", 1)[0]
-            current_params = params.copy()
-            
-            # --- NORMALIZE PARAMS (Fraction support) ---
-            current_params = self._normalize_params(current_params)
-
-            # --- 1. SENSOR LOGIC ---
-            if intent_name == "HassClimateGetTemperature" and domain == "sensor":
-                effective_intent = "HassGetState"
 
-            # --- 2. TIMEBOX / DELAY: TemporaryControl, TurnOn/Off+duration, DelayedControl ---
-            tb_result = await self._handle_timebox_or_delay(
-                intent_name, eid, current_params, language, timebox_failures
+        # Build the domain slot once per domain.
+        # HA intent handlers resolve a single 'name' per call, so dispatch stays per entity.
+        domains = dict.fromkeys(_entity_domain(eid) for eid in valid_ids)
+        domain_slots = (
+            {d: {"value": d} for d in domains} if "domain" not in params else {}
+        )
+        # Per-domain intent overrides, decided once per domain instead of per entity:
+        # a temperature query answered by a plain sensor is a state read.
+        bucket_intents = {
+            d: (
+                "HassGetState"
+                if intent_name == "HassClimateGetTemperature" and d == "sensor"
+                else intent_name
             )
-            if tb_result is not None:
-                effective_intent, resp = tb_result
-                if resp is not None:
-                    results.append((eid, resp))
-                    continue
-
-            # --- 3. LIGHT LOGIC ---
-            # Handle brightness from either 'brightness' or 'command' slot
-            brightness_val = current_params.get("brightness") or current_params.get("command")
-            
-            if intent_name == "HassLightSet" and brightness_val:
-                val = brightness_val
-
-                # Timebox: if duration specified and absolute brightness
-                minutes, seconds = self._extract_duration(current_params)
-                if (minutes > 0 or seconds > 0) and isinstance(val, int):
-                    # Call timebox with brightness value
-                    await self._call_timebox_script(eid, minutes, seconds, value=val)
-
-                    # Create fake response
-                    resp = ha_intent.IntentResponse(language=language)
-                    resp.response_type = ha_intent.IntentResponseType.ACTION_DONE
-                    results.append((eid, resp))
-                    continue
+            for d in domains
+        }
 
-                # Step up/down logic (RELATIVE brightness adjustments)
-                new_intent = self._handle_light_step(eid, current_params, final_executed_params)
-                if new_intent:
-                    effective_intent = new_intent
+        # --- NORMALIZE PARAMS (Fraction support) ---
+        normalized_params = self._normalize_params(params)
+        # No branch rewrites 'duration' per entity, so parse it once
+        duration = self._extract_duration(normalized_params)
+        shared_slots = self._build_shared_slots(normalized_params)
+
+        # Entities are independent, so dispatch them concurrently: wall-clock time
+        # becomes the slowest entity, not the sum.
+        # Context and language are the same for every entity's intent call
+        language = language or user_input.language or "de"
+        entity_run = _EntityRun(
+            user_input=user_input,
+            intent_name=intent_name,
+            params=normalized_params,
+            duration=duration,
+            language=language,
+            context=user_input.context or Context(),
+            shared_slots=shared_slots,
+            domain_slots=domain_slots,
+            executed_params=final_executed_params,
+        )
 
-            # --- 4. COVER: Step up/down logic (RELATIVE position adjustments) ---
-            if effective_intent == "HassSetPosition":
-                self._handle_cover_step(eid, current_params, final_executed_params)
+        # The semaphore caps in-flight dispatches so "all lights" does not flood HA.
+        semaphore = asyncio.Semaphore(self.MAX_PARALLEL_ENTITIES)
 
-            # --- 5. TIMEBOX: Cover/Fan/Climate intents ---
-            minutes, seconds = self._extract_duration(current_params)
-            if minutes > 0 or seconds > 0:
-                value_param = None
-                value = None
-
-                # Determine which parameter contains the value
-                if "position" in current_params:  # Cover
-                    value_param = "position"
-                    value = current_params["position"]
-                elif "percentage" in current_params:  # Fan
-                    value_param = "percentage"
-                    value = current_params["percentage"]
-                elif "temperature" in current_params:  # Climate
-                    value_param = "temperature"
-                    value = current_params["temperature"]
-
-                # If we found a value to timebox
-                if value is not None and isinstance(value, (int, float)):
-                    await self._call_timebox_script(
-                        eid, minutes, seconds, value=int(value)
-                    )
+        async def _dispatch(eid: str) -> Optional[tuple]:
+            domain = _entity_domain(eid)
+            async with semaphore:
+                return await self._handle_entity(
+                    entity_run, eid, domain, state_map[eid], bucket_intents[domain]
+                )
 
-                    # Create fake response
-                    resp = ha_intent.IntentResponse(language=language)
-                    resp.response_type = ha_intent.IntentResponseType.ACTION_DONE
-                    results.append((eid, resp))
-                    continue
+        # Results keep the input order, so the last requested entity answers
+        gathered = await asyncio.gather(
+            *(_dispatch(eid) for eid in valid_ids), return_exceptions=True
+        )
 
-            # --- 6. TIMER: Handle HassTimerSet directly via service call ---
-            if intent_name == "HassTimerSet":
-                minutes, seconds = self._extract_duration(current_params)
-                duration_sec = minutes * 60 + seconds
-                
-                if duration_sec > 0:
-                    try:
-                        await hass.services.async_call(
-                            "timer", "start",
-                            {"entity_id": eid, "duration": duration_sec},
-                            blocking=True
-                        )
-                        
-                        resp = ha_intent.IntentResponse(language=language)
-                        resp.response_type = ha_intent.IntentResponseType.ACTION_DONE
-                        
-                        state_obj = hass.states.get(eid)
-                        name = state_obj.attributes.get("friendly_name", eid) if state_obj else eid
-                        
-                        speech = build_confirmation(
-                            "HassTimerSet",
-                            [name],
-                            params={"duration": DURATION_TEMPLATES["minutes"].format(minutes=minutes) if minutes > 0 else DURATION_TEMPLATES["seconds"].format(seconds=seconds)}
-                        )
-                        resp.async_set_speech(speech)
-                        results.append((eid, resp))
-                        continue
-                    except Exception as e:
-                        _LOGGER.error("[IntentExecutor] Timer start failed for %s: %s", eid, e)
-                        # Fall through to let standard handler try (or fail)
-
-            # Slots
-            slots = {"name": {"value": eid}}
-            if "domain" not in current_params:
-                slots["domain"] = {"value": domain}
-            for k, v in current_params.items():
-                if k in self.RESOLUTION_KEYS or k == "name":
-                    continue
-                # Skip empty string values - they cause HA intent validation errors
-                if v == "" or v is None:
-                    continue
-                slots[k] = {"value": v}
-
-            _LOGGER.debug("[IntentExecutor] Executing %s on %s", effective_intent, eid)
-
-            try:
-                resp = await ha_intent.async_handle(
-                    hass,
-                    platform="conversation",
-                    intent_type=str(effective_intent),
-                    slots=slots,
-                    text_input=user_input.text,
-                    context=user_input.context or Context(),
-                    language=language or (user_input.language or "de"),
+        effective_intent = intent_name
+        for eid, outcome in zip(valid_ids, gathered):
+            if isinstance(outcome, BaseException):
+                self._raise_if_fatal(outcome)
+                _LOGGER.warning("[IntentExecutor] Error on %s: %s", eid, outcome)
+                continue
+            if outcome is None:
+                continue
+            effective_intent, resp = outcome
+            result_eids.append(eid)
+            result_resps.append(resp)
+
+        # Entities sharing script, duration and value/action get one script run.
+        # Scripts start before verification polling, so delays and durations count
+        # from the command rather than from the slowest state check.
+        # Dispatches queue in completion order; send batches in input order.
+        position = {eid: i for i, eid in enumerate(valid_ids)}
+        script_batches = sorted(
+            (
+                (key, sorted(eids, key=position.__getitem__))
+                for key, eids in entity_run.script_batch.items()
+            ),
+            key=lambda batch: position[batch[1][0]],
+        )
+        for (script, minutes, seconds, value, action), eids in script_batches:
+            call_script = (
+                self._call_timebox_script
+                if script == self.TIMEBOX_SCRIPT_ENTITY_ID
+                else self._call_delay_script
+            )
+            if not await call_script(eids, minutes, seconds, value=value, action=action):
+                timebox_failures.extend(eids)
+
+        async def _verify(eid, intent, expected_state, expected_brightness) -> bool:
+            async with semaphore:
+                return await self._verify_execution(
+                    eid, intent,
+                    expected_state=expected_state,
+                    expected_brightness=expected_brightness,
                 )
-                results.append((eid, resp))
-                
-                # Verify execution for certain intents
-                if effective_intent in ("HassTurnOn", "HassTurnOff", "HassLightSet"):
-                    expected_state = None
-                    expected_brightness = None
-                    
-                    if effective_intent == "HassTurnOn":
-                        expected_state = "on"
-                    elif effective_intent == "HassTurnOff":
-                        expected_state = "off"
-                    elif effective_intent == "HassLightSet":
-                        expected_state = "on"  # Light should be on after setting
-                        if "brightness" in current_params:
-                            expected_brightness = current_params["brightness"]
-                    
-                    verified = await self._verify_execution(
-                        eid, effective_intent, 
-                        expected_state=expected_state,
-                        expected_brightness=expected_brightness
-                    )
-                    
-                    # Track verification failures
-                    if not verified:
-                        verification_failures.append(eid)
-                    
-            except Exception as e:
-                _LOGGER.warning("[IntentExecutor] Error on %s: %s", eid, e)
 
-        if not results:
+        verified = await asyncio.gather(
+            *(_verify(*check) for check in entity_run.verifications),
+            return_exceptions=True,
+        )
+        verification_failures = []
+        for check, ok in zip(entity_run.verifications, verified):
+            if isinstance(ok, BaseException):
+                self._raise_if_fatal(ok)
+                _LOGGER.warning("[IntentExecutor] Verification error on %s: %s", check[0], ok)
+                verification_failures.append(check[0])
+            elif not ok:
+                verification_failures.append(check[0])
+
+        if not result_resps:
             return {}
 
         # If ALL timebox calls failed, return error message (but as ACTION_DONE to avoid error_code requirement)
@@ -917,45 +1161,32 @@ class IntentExecutorCapability(Capability):
             resp.response_type = ha_intent.IntentResponseType.ACTION_DONE
             resp.async_set_speech(ERROR_MESSAGES["timebox_failed"])
             return {
-                "result": ConversationResult(
-                    response=resp,
-                    conversation_id=user_input.conversation_id,
-                    continue_conversation=False,
-                ),
+                "result": self._conversation_result(user_input, resp),
                 "executed_params": final_executed_params,
                 "error": True,
             }
 
-        final_resp = results[-1][1]
-
-        # Speech Generation for State Queries
-        if effective_intent in ("HassGetState", "HassClimateGetTemperature"):
-            current_speech = (
-                final_resp.speech.get("plain", {}).get("speech", "")
-                if final_resp.speech
-                else ""
-            )
+        final_resp = result_resps[-1]
 
-            if not current_speech or current_speech.strip() == SYSTEM_MESSAGES["ok"]:
-                speech_text = self._build_state_query_speech(
-                    user_input, results, entity_ids, all_entity_ids, params, language
-                )
-                if speech_text:
-                    final_resp.async_set_speech(speech_text)
+        current_speech = self._plain_speech(final_resp)
 
-        def _has_speech(r):
-            s = getattr(r, "speech", None)
-            return isinstance(s, dict) and bool(s.get("plain", {}).get("speech"))
+        # Speech Generation for State Queries, only when HA gave no real answer
+        if effective_intent in _STATE_QUERY_INTENTS and (
+            not current_speech or current_speech.strip() == CONFIRMATION_TEMPLATES["ok"]
+        ):
+            speech_text = self._build_state_query_speech(
+                user_input, result_eids, entity_ids, all_entity_ids, params, language,
+                state_map,
+            )
+            if speech_text:
+                final_resp.async_set_speech(speech_text)
+                current_speech = speech_text
 
-        if not _has_speech(final_resp):
-            final_resp.async_set_speech(SYSTEM_MESSAGES["ok"])
+        if not current_speech:
+            final_resp.async_set_speech(CONFIRMATION_TEMPLATES["ok"])
 
         return {
-            "result": ConversationResult(
-                response=final_resp,
-                conversation_id=user_input.conversation_id,
-                continue_conversation=False,
-            ),
+            "result": self._conversation_result(user_input, final_resp),
             "executed_params": final_executed_params,
             "verification_failures": verification_failures,
         }
@@ -979,7 +1210,7 @@ class IntentExecutorCapability(Capability):
             True if verification passed, False if there's a mismatch
         """
         # Domain-specific verification timeouts (seconds)
-        domain = entity_id.split(".")[0]
+        domain = _entity_domain(entity_id)
         timeout_map = {
             "media_player": 10.0,  # Radios need boot time
             "climate": 5.0,        # HVAC can be slow
@@ -987,7 +1218,6 @@ class IntentExecutorCapability(Capability):
         }
         max_wait = timeout_map.get(domain, 2.0)  # Default 2 seconds
         
-        import time
         start_time = time.time()
         last_state = None
         
@@ -1054,8 +1284,8 @@ class IntentExecutorCapability(Capability):
 
             # Check brightness if applicable
             if expected_brightness is not None:
-                cur_255 = state.attributes.get("brightness") or 0
-                cur_pct = int((cur_255 / 255.0) * 100)
+                cur_255 = int(state.attributes.get("brightness") or 0)
+                cur_pct = cur_255 * 100 // 255
                 if abs(cur_pct - expected_brightness) <= 5:
                     _LOGGER.debug("[IntentExecutor] Verification passed for %s (brightness: %d%%)", entity_id, cur_pct)
                     return True
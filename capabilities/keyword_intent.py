@@ -1,5 +1,7 @@
 import logging
-from typing import Any, Dict, Optional, List
+import re
+from functools import lru_cache
+from typing import Any, Dict, Optional, List, Tuple
 
 from .base import Capability
 from ..utils.german_utils import (
@@ -7,8 +9,9 @@ from ..utils.german_utils import (
     IMPLICIT_PHRASES,
     GERMAN_ARTICLES,
     GERMAN_PREPOSITIONS,
+    normalize_umlauts,
 )
-from ..utils.fuzzy_utils import levenshtein_distance
+from ..utils.fuzzy_utils import get_fuzz, levenshtein_distance
 from ..constants.entity_keywords import (
     LIGHT_KEYWORDS,
     COVER_KEYWORDS,
@@ -26,13 +29,56 @@ from ..constants.entity_keywords import (
 _LOGGER = logging.getLogger(__name__)
 
 
+def _keyword_tuple(keywords: List[str]) -> Tuple[str, ...]:
+    """Deduplicate keywords and order them longest (most specific) first."""
+    return tuple(sorted(dict.fromkeys(keywords), key=len, reverse=True))
+
+
+# Slot properties the LLM sometimes returns at the top level instead of under "slots"
+_TOP_LEVEL_SLOTS = (
+    "area", "floor", "domain", "command", "duration",
+    "position", "brightness", "temperature", "device_class", "state",
+)
+
+# Quantifiers the LLM occasionally puts into area/name
+_QUANTIFIER_WORDS = frozenset({"alle", "alles", "ganze", "gesamte", "sämtliche"})
+
+_SHORT_KEYWORD_LEN = 4
+
+# Standalone adjectives also need a leading boundary, so "Schwarm"/"lauwarm" don't
+# hit "warm". Nouns like "wert"/"grad" stay compound tails ("Messwert", "20grad").
+_WHOLE_WORD_KEYWORDS = frozenset({"warm", "kalt"})
+
+# Minimum keyword length to apply fuzzy matching (avoid matching "an" to "auf")
+_FUZZY_MIN_LEN = 5
+_FUZZY_MAX_DISTANCE = 2
+
+
+def _keyword_regex(keyword: str) -> str:
+    """Regex for a domain keyword; short keywords may not run into a longer word."""
+    if keyword in _WHOLE_WORD_KEYWORDS:
+        return r"(?<!\w)" + re.escape(keyword) + r"(?!\w)"
+    if len(keyword) <= _SHORT_KEYWORD_LEN:
+        return re.escape(keyword) + r"(?!\w)"
+    return re.escape(keyword)
+
+
+def _keywords_by_length(
+    keywords_by_domain: Dict[str, Tuple[str, ...]], min_length: int = 0
+) -> Dict[int, Tuple[Tuple[str, str], ...]]:
+    """Index (domain, keyword) pairs by keyword length, keeping domain order."""
+    by_length: Dict[int, List[Tuple[str, str]]] = {}
+    for domain, keywords in keywords_by_domain.items():
+        for kw in keywords:
+            if len(kw) < min_length:
+                continue
+            by_length.setdefault(len(kw), []).append((domain, kw))
+    return {length: tuple(pairs) for length, pairs in by_length.items()}
+
+
 def _extract_nouns(keywords_dict: Dict[str, str]) -> List[str]:
     """Extract nouns from 'article noun' format keywords."""
-    nouns = []
-    for key, value in keywords_dict.items():
-        nouns.append(key.split()[-1])
-        nouns.append(value.split()[-1])
-    return nouns
+    return [word.rpartition(" ")[2] for pair in keywords_dict.items() for word in pair]
 
 
 class KeywordIntentCapability(Capability):
@@ -41,20 +87,46 @@ class KeywordIntentCapability(Capability):
     name = "keyword_intent"
     description = "Determine the target domain and intent from natural language using tiered matching: 1. Exact string matching against domain keyword dictionaries 2. Fuzzy Levenshtein distance matching for typos 3. Specialized LLM reasoning for slot extraction (area, floor, parameters). Supports complex control modes like Temporary and Delayed control."
 
+    MIN_TEXT_LEN = 3
+    MAX_SCAN_LEN = 512
+
+    # Singular/plural pairs often share a noun, so the lists are deduplicated
     DOMAIN_KEYWORDS = {
-        "light": _extract_nouns(LIGHT_KEYWORDS),
-        "cover": _extract_nouns(COVER_KEYWORDS),
-        "switch": _extract_nouns(SWITCH_KEYWORDS),
-        "fan": _extract_nouns(FAN_KEYWORDS),
-        "media_player": _extract_nouns(MEDIA_KEYWORDS),
-        "sensor": _extract_nouns(SENSOR_KEYWORDS) + ["grad", "warm", "kalt", "wieviel"],
-        "climate": _extract_nouns(CLIMATE_KEYWORDS),
-        "timer": TIMER_KEYWORDS,
-        "vacuum": VACUUM_KEYWORDS,
-        "calendar": CALENDAR_KEYWORDS,
-        "automation": AUTOMATION_KEYWORDS,
+        "light": _keyword_tuple(_extract_nouns(LIGHT_KEYWORDS)),
+        "cover": _keyword_tuple(_extract_nouns(COVER_KEYWORDS)),
+        "switch": _keyword_tuple(_extract_nouns(SWITCH_KEYWORDS)),
+        "fan": _keyword_tuple(_extract_nouns(FAN_KEYWORDS)),
+        "media_player": _keyword_tuple(_extract_nouns(MEDIA_KEYWORDS)),
+        "sensor": _keyword_tuple(
+            _extract_nouns(SENSOR_KEYWORDS) + ["grad", "warm", "kalt", "wieviel"]
+        ),
+        "climate": _keyword_tuple(_extract_nouns(CLIMATE_KEYWORDS)),
+        "timer": _keyword_tuple(TIMER_KEYWORDS),
+        "vacuum": _keyword_tuple(VACUUM_KEYWORDS),
+        "calendar": _keyword_tuple(CALENDAR_KEYWORDS),
+        "automation": _keyword_tuple(AUTOMATION_KEYWORDS),
     }
 
+    # Detection compares umlaut-normalized text, so "Rollaeden" and "Rolläden" both hit
+    _MATCH_KEYWORDS = {
+        domain: _keyword_tuple([normalize_umlauts(k) for k in keywords])
+        for domain, keywords in DOMAIN_KEYWORDS.items()
+    }
+
+    # One alternation per domain: a single C-level search replaces the per-keyword
+    # substring loop. Keywords match inside compounds ("Deckenlicht"), but short
+    # ones must end a word so "Spotify" or "Bewertung" don't hit "spot"/"wert",
+    # and adjectives must be whole words ("Schwarm" is not "warm").
+    _DOMAIN_PATTERNS = {
+        domain: re.compile("|".join(_keyword_regex(k) for k in keywords if k))
+        for domain, keywords in _MATCH_KEYWORDS.items()
+        if any(keywords)
+    }
+
+    # Fuzzy matching only compares equal-length words, so bucket keywords by length.
+    # Shorter keywords only ever match exactly, which the regex pass already covers.
+    _FUZZY_KEYWORDS = _keywords_by_length(_MATCH_KEYWORDS, _FUZZY_MIN_LEN)
+
     # Common rule for temp control
     _TEMP_RULE = """
 - 'TemporaryControl': Use this if a DURATION is specified with the preposition for temporary action.
@@ -70,6 +142,9 @@ class KeywordIntentCapability(Capability):
   - 'command': "on" or "off".
 """""
 
+    # Shared by every controllable domain; built once, referenced by each entry
+    _CONTROL_RULES = _TEMP_RULE + _DELAYED_RULE
+
     INTENT_DATA = {
         "light": {
             "intents": [
@@ -85,7 +160,7 @@ class KeywordIntentCapability(Capability):
 - 'brightness': use integer 0-100 ONLY for explicit percentages.
 - Do NOT put step_up/step_down in brightness slot!
 """
-            + _TEMP_RULE + _DELAYED_RULE,
+            + _CONTROL_RULES,
         },
         "cover": {
             "intents": [
@@ -96,7 +171,7 @@ class KeywordIntentCapability(Capability):
                 "TemporaryControl",
                 "DelayedControl",
             ],
-            "rules": _TEMP_RULE + _DELAYED_RULE,
+            "rules": _CONTROL_RULES,
         },
         "switch": {
             "intents": [
@@ -106,7 +181,7 @@ class KeywordIntentCapability(Capability):
                 "TemporaryControl",
                 "DelayedControl",
             ],
-            "rules": _TEMP_RULE + _DELAYED_RULE,
+            "rules": _CONTROL_RULES,
         },
         "fan": {
             "intents": [
@@ -116,7 +191,7 @@ class KeywordIntentCapability(Capability):
                 "TemporaryControl",
                 "DelayedControl",
             ],
-            "rules": _TEMP_RULE + _DELAYED_RULE,
+            "rules": _CONTROL_RULES,
         },
         "media_player": {
             "intents": ["HassTurnOn", "HassTurnOff", "HassGetState"],
@@ -157,7 +232,7 @@ class KeywordIntentCapability(Capability):
             "rules": """- 'name': The automation/device name.
 - If DURATION specified for temporary action, use TemporaryControl.
 - If DELAYED to a future time, use DelayedControl.
-""" + _TEMP_RULE + _DELAYED_RULE,
+""" + _CONTROL_RULES,
         },
     }
 
@@ -190,7 +265,8 @@ class KeywordIntentCapability(Capability):
         "required": ["intent", "slots"]
     }
 
-    def _fuzzy_match_distance(self, word: str, keyword: str, max_distance: int = 2) -> Optional[int]:
+    @staticmethod
+    def _fuzzy_match_distance(word: str, keyword: str, max_distance: int = _FUZZY_MAX_DISTANCE) -> Optional[int]:
         """Return edit distance if within threshold, else None.
         
         Strict same-length matching to catch typos without false positives.
@@ -198,11 +274,11 @@ class KeywordIntentCapability(Capability):
         if len(word) != len(keyword):
             return None
         
-        # Minimum length to apply fuzzy (avoid matching "an" to "auf")
-        if len(keyword) < 5:
+        if len(keyword) < _FUZZY_MIN_LEN:
             return 0 if word == keyword else None
         
-        dist = levenshtein_distance(word, keyword)
+        # The cutoff lets rapidfuzz stop as soon as the distance exceeds max_distance
+        dist = levenshtein_distance(word, keyword, score_cutoff=max_distance)
         return dist if dist <= max_distance else None
 
 
@@ -220,14 +296,48 @@ class KeywordIntentCapability(Capability):
             return result
         return None
 
-    def _detect_domain(self, text: str) -> Optional[str]:
-        t = text.lower()
-        words = t.split()
+    _SYSTEM_PROMPT_HEAD = (
+        "You are a smart home assistant. "
+        "Identify the intent and extract slots from the user's command.\n"
+    )
+
+    _GET_STATE_BLOCK = """
+- For HassGetState: use 'state' slot to capture the QUERIED state (on/off/open/closed)."""
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _domain_prompt(cls, domain: str) -> str:
+        """Render the domain-specific part of the system prompt (cached per domain)."""
+        meta = cls.INTENT_DATA.get(domain) or {}
+        intents = meta.get('intents', [])
         
+        # Build conditional instructions
+        get_state_instructions = cls._GET_STATE_BLOCK if "HassGetState" in intents else ""
+
+        return f"""Allowed Intents: {', '.join(intents)}
+Allowed Slots: area, name, domain, floor, duration, command, device_class, position, temperature, brightness.
+
+Rules: {meta.get('rules', '')}
+- Use 'floor' for floor/level references.
+- Use 'area' for room/area/location references.
+- If generic device words are used without a specific name, 'name' must be EMPTY.
+- Do NOT put quantifiers like 'all' in 'area' or 'name'.
+- ALWAYS use one of the "Allowed Intents" exactly as written.
+{get_state_instructions}
+"""
+
+    def _detect_domain(self, text: str) -> Optional[str]:
+        # Nothing to detect in empty/trivial input; bound the scan on runaway ASR output
+        if not text or len(text.strip()) < self.MIN_TEXT_LEN:
+            return None
+        return self._detect_domain_lower(normalize_umlauts(text[: self.MAX_SCAN_LEN].lower()))
+
+    @classmethod
+    @lru_cache(maxsize=512)
+    def _detect_domain_lower(cls, t: str) -> Optional[str]:
+        """Detect the domain of lowercased, umlaut-normalized text (memoized)."""
         # First pass: exact substring match
-        matches = [
-            d for d, kws in self.DOMAIN_KEYWORDS.items() if any(k in t for k in kws)
-        ]
+        matches = [d for d, pattern in cls._DOMAIN_PATTERNS.items() if pattern.search(t)]
         
         if len(matches) == 1:
             return matches[0]
@@ -244,19 +354,18 @@ class KeywordIntentCapability(Capability):
         if matches:
             return matches[0]
         
-        # Second pass: fuzzy match - collect ALL matches with distances, pick BEST
-        candidates = []  # (domain, keyword, distance)
-        for word in words:
-            for domain, keywords in self.DOMAIN_KEYWORDS.items():
-                for kw in keywords:
-                    dist = self._fuzzy_match_distance(word, kw)
-                    if dist is not None:
-                        candidates.append((domain, kw, dist, word))
+        # Second pass: fuzzy match - keep the first candidate with the smallest distance.
+        # Buckets already enforce _fuzzy_match_distance's length rules, so only the
+        # distance itself is left to compute.
+        best = None  # (domain, keyword, distance, word)
+        # A repeated word can't beat its first occurrence, so score it once
+        for word in dict.fromkeys(t.split()):
+            for domain, kw in cls._FUZZY_KEYWORDS.get(len(word), ()):
+                dist = levenshtein_distance(word, kw, score_cutoff=_FUZZY_MAX_DISTANCE)
+                if dist <= _FUZZY_MAX_DISTANCE and (best is None or dist < best[2]):
+                    best = (domain, kw, dist, word)
         
-        if candidates:
-            # Sort by distance (ascending), pick smallest
-            candidates.sort(key=lambda x: x[2])
-            best = candidates[0]
+        if best:
             _LOGGER.debug(
                 "[KeywordIntent] Fuzzy match: '%s' → '%s' (domain=%s, dist=%d)", 
                 best[3], best[1], best[0], best[2]
@@ -267,55 +376,39 @@ class KeywordIntentCapability(Capability):
 
     async def run(self, user_input, **_: Any) -> Dict[str, Any]:
         text = user_input.text
+        # Load rapidfuzz (off the event loop, once) so the fuzzy pass uses its C Levenshtein
+        await get_fuzz()
         domain = self._detect_domain(text)
         if not domain:
             return {}
 
-        meta = self.INTENT_DATA.get(domain) or {}
-        intents = meta.get('intents', [])
-        
-        # Build conditional instructions
-        get_state_instructions = ""
-        if "HassGetState" in intents:
-            get_state_instructions = """
-- For HassGetState: use 'state' slot to capture the QUERIED state (on/off/open/closed)."""
-
         personal_info = ""
         if self.memory:
             data = await self.memory.get_all_personal_data()
             if data:
                 personal_info = "Known Personal Information:\n" + "\n".join(f"- {k}: {v}" for k, v in data.items()) + "\n\n"
 
-        system = f"""You are a smart home assistant. Identify the intent and extract slots from the user's command.
-{personal_info}Allowed Intents: {', '.join(intents)}
-Allowed Slots: area, name, domain, floor, duration, command, device_class, position, temperature, brightness.
-
-Rules: {meta.get('rules', '')}
-- Use 'floor' for floor/level references.
-- Use 'area' for room/area/location references.
-- If generic device words are used without a specific name, 'name' must be EMPTY.
-- Do NOT put quantifiers like 'all' in 'area' or 'name'.
-- ALWAYS use one of the "Allowed Intents" exactly as written.
-{get_state_instructions}
-"""
+        system = self._SYSTEM_PROMPT_HEAD + personal_info + self._domain_prompt(domain)
         data = await self._safe_prompt(
             {"system": system, "schema": self.SCHEMA}, {"user_input": text}
         )
 
-        if not isinstance(data, dict):
+        try:
+            intent = data["intent"]
+        except KeyError:
+            intent = None
+        except TypeError:
             _LOGGER.warning("[KeywordIntent] Bad data type from prompt_executor: %s", type(data))
             return {}
-        if not data.get("intent"):
+        if not intent:
             _LOGGER.warning("[KeywordIntent] No intent extracted: %s", data)
             return {}
 
-        slots = data.get("slots") or {}
+        slots = data.get("slots")
+        if not isinstance(slots, dict):
+            slots = {}
         # Merge top-level properties from schema into slots (Ollama often puts them at top level)
-        known_slots = [
-            "area", "floor", "domain", "command", "duration", 
-            "position", "brightness", "temperature", "device_class", "state"
-        ]
-        for prop in known_slots:
+        for prop in _TOP_LEVEL_SLOTS:
             val = data.get(prop)
             if val is not None and val != "" and not slots.get(prop):
                 slots[prop] = val
@@ -328,9 +421,9 @@ Rules: {meta.get('rules', '')}
             slots["domain"] = domain
             
         # Post-processing: Remove "alle" from area/name if LLM put it there
-        if slots.get("area") and str(slots["area"]).lower() in ("alle", "alles", "ganze", "gesamte", "sämtliche"):
+        if slots.get("area") and str(slots["area"]).lower() in _QUANTIFIER_WORDS:
             slots["area"] = None
-        if slots.get("name") and str(slots["name"]).lower() in ("alle", "alles", "ganze", "gesamte", "sämtliche"):
+        if slots.get("name") and str(slots["name"]).lower() in _QUANTIFIER_WORDS:
             slots["name"] = None
 
-        return {"domain": domain, "intent": data["intent"], "slots": slots}
+        return {"domain": domain, "intent": intent, "slots": slots}
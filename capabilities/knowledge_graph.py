@@ -9,9 +9,11 @@ The Knowledge Graph centralizes:
 
 import logging
 import asyncio
+import weakref
 from enum import Enum
+from types import MappingProxyType
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
 from homeassistant.helpers.storage import Store
 from .base import Capability
@@ -21,6 +23,8 @@ _LOGGER = logging.getLogger(__name__)
 STORAGE_KEY = "multistage_assist_knowledge"
 LEGACY_MEMORY_KEY = "multistage_assist_memory"
 STORAGE_VERSION = 1
+# Seconds to coalesce learned aliases/facts before rewriting the storage file
+SAVE_DELAY = 10
 
 
 class RelationType(Enum):
@@ -83,11 +87,16 @@ class KnowledgeGraphCapability(Capability):
     name = "knowledge_graph"
     description = "A unified storage for Home Assistant context, including: 1. Physical and logical device dependencies (power/energy) 2. Personal memory (facts about users) 3. Area/Floor/Entity aliases learned over time. Acts as the persistent memory layer for context-aware reasoning."
 
+    # Live instances (one per stage plus CommandProcessor.memory), flushed on entry unload
+    _instances: "weakref.WeakSet[KnowledgeGraphCapability]" = weakref.WeakSet()
+
     def __init__(self, hass, config):
         super().__init__(hass, config)
         self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
         self._data = None  # Lazy load
         self._lock = asyncio.Lock()
+        self._save_pending = False
+        self._instances.add(self)
 
     async def _ensure_loaded(self):
         """Lazy load data and perform migrations if needed."""
@@ -119,10 +128,33 @@ class KnowledgeGraphCapability(Capability):
             
             _LOGGER.debug("[KnowledgeGraph] Loaded data: %s", self._data)
 
-    async def _save(self):
-        """Save data to storage."""
-        async with self._lock:
-            await self._store.async_save(self._data)
+    def _save(self):
+        """Schedule a debounced save; bursts of changes collapse into one write."""
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Snapshot for the delayed write; the changes are no longer pending."""
+        self._save_pending = False
+        return self._data
+
+    async def async_flush(self):
+        """Write pending changes now instead of after SAVE_DELAY."""
+        if not self._save_pending or self._data is None:
+            return
+        self._save_pending = False
+        # async_save also cancels the store's pending delayed write
+        await self._store.async_save(self._data)
+
+    @classmethod
+    async def async_flush_all(cls):
+        """Flush every live instance (entry unload, before a reload reads the file)."""
+        results = await asyncio.gather(
+            *(kg.async_flush() for kg in list(cls._instances)), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.error("[KnowledgeGraph] Flush on unload failed: %s", result)
 
     # --- Alias Management (Legacy Memory functionality) ---
 
@@ -130,12 +162,21 @@ class KnowledgeGraphCapability(Capability):
         await self._ensure_loaded()
         return self._data["areas"].get(text.lower().strip())
 
+    async def get_area_aliases(self) -> Mapping[str, str]:
+        """Return all learned area aliases (lowercase alias -> area name).
+
+        The mapping is a read-only view of the live table, so it reflects later
+        learned aliases; use learn_area_alias() to change it.
+        """
+        await self._ensure_loaded()
+        return MappingProxyType(self._data["areas"])
+
     async def learn_area_alias(self, text: str, area_name: str):
         await self._ensure_loaded()
         key = text.lower().strip()
         if self._data["areas"].get(key) != area_name:
             self._data["areas"][key] = area_name
-            await self._save()
+            self._save()
 
     async def get_entity_alias(self, text: str) -> Optional[str]:
         await self._ensure_loaded()
@@ -146,7 +187,7 @@ class KnowledgeGraphCapability(Capability):
         key = text.lower().strip()
         if self._data["entities"].get(key) != entity_id:
             self._data["entities"][key] = entity_id
-            await self._save()
+            self._save()
 
     # --- Personal Data ---
 
@@ -163,7 +204,7 @@ class KnowledgeGraphCapability(Capability):
         k = key.lower().strip()
         if self._data["personal"].get(k) != value:
             self._data["personal"][k] = value
-            await self._save()
+            self._save()
 
     # --- Relationship Resolution (Legacy KnowledgeGraph utility functionality) ---
 
@@ -177,7 +218,7 @@ class KnowledgeGraphCapability(Capability):
             "relation": relation.value,
             "mode": mode.value
         }
-        await self._save()
+        self._save()
         _LOGGER.info("[KnowledgeGraph] Learned dependency: %s", key)
 
     async def remove_dependency(self, source: str, target: str):
@@ -186,7 +227,7 @@ class KnowledgeGraphCapability(Capability):
         key = f"{source} -> {target}"
         if key in self._data["relationships"]:
             del self._data["relationships"][key]
-            await self._save()
+            self._save()
             _LOGGER.info("[KnowledgeGraph] Removed dependency: %s", key)
 
     async def get_dependencies(self, entity_id: str) -> List[Dependency]:
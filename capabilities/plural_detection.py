@@ -1,4 +1,5 @@
 import logging
+import re
 from typing import Any, Dict
 from .base import Capability
 from ..conversation_utils import (
@@ -20,6 +21,29 @@ for sing, plur in _ENTITY_PLURALS.items():
     _SINGULAR_NOUNS.add(sing_noun)
     _PLURAL_NOUNS.add(plur_noun)
 
+_ALL_NOUNS = _PLURAL_NOUNS | _SINGULAR_NOUNS
+
+# Word tokens without attached punctuation ("alle," → "alle")
+_WORD_PATTERN = re.compile(r"\w+")
+
+# Quantifier cues as whole tokens, with their inflected forms ("allen", "beiden",
+# "mehreren") so a token lookup covers what the old substring scan matched,
+# without hitting words that merely contain a cue ("Halle", "alleine").
+_PLURAL_CUE_WORDS = frozenset(_PLURAL_CUES) | frozenset(
+    cue + ending for cue in _PLURAL_CUES if cue.endswith("e") for ending in ("n", "r", "s")
+)
+
+# Compound words ("Deckenlichter", "Stehlampe") end with a known noun. Only nouns
+# whose singular and plural differ say anything about number; very short ones
+# ("tor", "tv") end too many unrelated words.
+_MIN_SUFFIX_LEN = 4
+_PLURAL_SUFFIXES = tuple(
+    n for n in _PLURAL_NOUNS - _SINGULAR_NOUNS if len(n) >= _MIN_SUFFIX_LEN
+)
+_SINGULAR_SUFFIXES = tuple(
+    n for n in _SINGULAR_NOUNS - _PLURAL_NOUNS if len(n) >= _MIN_SUFFIX_LEN
+)
+
 
 class PluralDetectionCapability(Capability):
     """Detect plural references in German smart-home commands."""
@@ -40,20 +64,22 @@ Rules:
 
     async def run(self, user_input, **_: Any) -> Dict[str, Any]:
         text = user_input.text.lower().strip()
-        words = set(text.split())
+        words = set(_WORD_PATTERN.findall(text))
 
         # Fast Path: Check for explicit plural cues ("alle", "beide", etc.)
-        if any(cue in text for cue in _PLURAL_CUES):
+        if words & _PLURAL_CUE_WORDS:
             return {"multiple_entities": True}
 
-        # Check for plural nouns (without articles)
-        if words & _PLURAL_NOUNS:
-            _LOGGER.debug("[PluralDetection] Found plural noun in: %s", words & _PLURAL_NOUNS)
+        # Check for known nouns (without articles); a plural noun wins over a singular one
+        nouns = words & _ALL_NOUNS
+        if nouns:
+            _LOGGER.debug("[PluralDetection] Found nouns: %s", nouns)
+            return {"multiple_entities": bool(nouns & _PLURAL_NOUNS)}
+
+        # Check compound nouns by their trailing noun
+        if any(word.endswith(_PLURAL_SUFFIXES) for word in words):
             return {"multiple_entities": True}
-        
-        # Check for singular nouns (without articles)
-        if words & _SINGULAR_NOUNS:
-            _LOGGER.debug("[PluralDetection] Found singular noun in: %s", words & _SINGULAR_NOUNS)
+        if any(word.endswith(_SINGULAR_SUFFIXES) for word in words):
             return {"multiple_entities": False}
 
         # Fallback to LLM if no fast path matches
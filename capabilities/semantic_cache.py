@@ -11,10 +11,12 @@ Config options:
 """
 
 import asyncio
+import heapq
 import json
 import logging
 import os
 import time
+from collections import OrderedDict
 from dataclasses import asdict
 from typing import Any, Dict, List, Optional, Set
 
@@ -32,6 +34,12 @@ from ..utils.semantic_cache_types import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Recently embedded query texts kept in memory (repeated phrases skip the add-on)
+QUERY_EMBEDDING_CACHE_SIZE = 64
+
+# Seconds to coalesce cache file writes (hit counters and new entries)
+SAVE_DELAY = 5.0
+
 class SemanticCacheCapability(Capability):
     """Semantic cache with add-on lookup and local storage for learning."""
 
@@ -57,6 +65,8 @@ class SemanticCacheCapability(Capability):
         }
         self._loaded = False
         self._embedding_dim: Optional[int] = None
+        self._query_emb_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._save_handle: Optional[asyncio.TimerHandle] = None
 
         from ..const import CONF_CACHE_ADDON_IP, CONF_CACHE_ADDON_PORT, DEFAULT_CACHE_ADDON_HOST
         
@@ -121,9 +131,7 @@ class SemanticCacheCapability(Capability):
         if self._cache:
             valid_embeddings = [np.array(e.embedding, dtype=np.float32) for e in self._cache if e.embedding]
             if valid_embeddings:
-                self._embeddings_matrix = np.vstack(valid_embeddings)
-                norms = np.linalg.norm(self._embeddings_matrix, axis=1, keepdims=True)
-                self._embeddings_matrix = self._embeddings_matrix / (norms + 1e-10)
+                self._embeddings_matrix = self._normalize_rows(np.vstack(valid_embeddings))
                 self._embedding_dim = self._embeddings_matrix.shape[1]
             
         self._loaded = True
@@ -140,6 +148,18 @@ class SemanticCacheCapability(Capability):
         except Exception as e:
             _LOGGER.error("[SemanticCache] Anchor generation failed: %s", e)
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return Home Assistant's shared client session for add-on calls."""
+        from homeassistant.helpers.aiohttp_client import async_get_clientsession
+        return async_get_clientsession(self.hass)
+
+    async def async_shutdown(self, _event=None):
+        """Flush a pending cache write (entry unload or HA stop)."""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+            await self._save_cache()
+
     def _addon_url(self, endpoint: str) -> str:
         """Get add-on API URL."""
         return f"http://{self.addon_ip}:{self.addon_port}{endpoint}"
@@ -162,37 +182,46 @@ class SemanticCacheCapability(Capability):
             headers["Authorization"] = f"Bearer {self.prod_cache_key}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload, timeout=60, headers=headers) as resp:
-                    if resp.status != 200:
-                        _LOGGER.warning("[SemanticCache] Batch embed failed: %d", resp.status)
-                        return None
-                    data = await resp.json()
-                    return [np.array(entry["embedding"], dtype=np.float32) for entry in data.get("entries", [])]
+            async with self._get_session().post(url, json=payload, timeout=60, headers=headers) as resp:
+                if resp.status != 200:
+                    _LOGGER.warning("[SemanticCache] Batch embed failed: %d", resp.status)
+                    return None
+                data = await resp.json()
+                return [np.array(entry["embedding"], dtype=np.float32) for entry in data.get("entries", [])]
         except Exception as e:
             _LOGGER.error("[SemanticCache] Batch embed error: %s", e)
             return None
 
     async def _get_embedding(self, text: str) -> Optional[np.ndarray]:
         """Get embedding for normalized text using the addon's /embed/text endpoint."""
+        key = text.strip() # Already lower/normed from normalize_for_cache
+        cached = self._query_emb_cache.get(key)
+        if cached is not None:
+            self._query_emb_cache.move_to_end(key)
+            return cached
+
         url = self._embedding_url("/embed/text")
-        payload = {"text": text.strip()} # Already lower/normed from normalize_for_cache
+        payload = {"text": key}
         
         headers = {}
         if self.prod_cache_key:
             headers["Authorization"] = f"Bearer {self.prod_cache_key}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload, timeout=15, headers=headers) as resp:
-                    if resp.status != 200:
-                        _LOGGER.warning("[SemanticCache] Add-on embedding failed: %d (check PROD_CACHE_KEY)", resp.status)
-                        return None
-                    data = await resp.json()
-                    embedding = np.array(data["embedding"], dtype=np.float32)
-                    if self._embedding_dim is None:
-                        self._embedding_dim = len(embedding)
-                    return embedding
+            async with self._get_session().post(url, json=payload, timeout=15, headers=headers) as resp:
+                if resp.status != 200:
+                    _LOGGER.warning("[SemanticCache] Add-on embedding failed: %d (check PROD_CACHE_KEY)", resp.status)
+                    return None
+                data = await resp.json()
+                embedding = np.array(data["embedding"], dtype=np.float32)
+                if self._embedding_dim is None:
+                    self._embedding_dim = len(embedding)
+                # Shared between callers via the cache, so keep it read-only
+                embedding.setflags(write=False)
+                self._query_emb_cache[key] = embedding
+                if len(self._query_emb_cache) > QUERY_EMBEDDING_CACHE_SIZE:
+                    self._query_emb_cache.popitem(last=False)
+                return embedding
         except Exception as e:
             _LOGGER.error("[SemanticCache] Add-on embedding error: %s", e)
             return None
@@ -251,7 +280,7 @@ class SemanticCacheCapability(Capability):
                         self._stats["cache_hits"] += 1
                         candidate.hits += 1
                         candidate.last_hit = time.strftime("%Y-%m-%dT%H:%M:%S")
-                        self.hass.async_create_task(self._save_cache())
+                        self._schedule_save()
                         
                         return {
                             "intent": candidate.intent,
@@ -262,12 +291,15 @@ class SemanticCacheCapability(Capability):
 
         # 3. Remote Lookup
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                async with session.post(self._addon_url("/lookup"), json={"query": query_norm, "top_k": 5}) as resp:
-                    if resp.status != 200:
-                        self._stats["api_errors"] += 1
-                        return None
-                    data = await resp.json()
+            async with self._get_session().post(
+                self._addon_url("/lookup"),
+                json={"query": query_norm, "top_k": 5},
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as resp:
+                if resp.status != 200:
+                    self._stats["api_errors"] += 1
+                    return None
+                data = await resp.json()
         except Exception:
             self._stats["api_errors"] += 1
             return None
@@ -343,7 +375,7 @@ class SemanticCacheCapability(Capability):
                 idx = int(np.argmax(similarities))
                 self._cache[idx].hits += 1
                 self._cache[idx].last_hit = time.strftime("%Y-%m-%dT%H:%M:%S")
-                await self._save_cache()
+                self._schedule_save()
                 return
 
         # Strip variable context from timer/calendar before caching
@@ -360,17 +392,23 @@ class SemanticCacheCapability(Capability):
         )
 
         self._cache.append(entry)
+        row = self._normalize_rows(embedding.reshape(1, -1))
         if self._embeddings_matrix is None:
-            self._embeddings_matrix = embedding.reshape(1, -1)
+            self._embeddings_matrix = row
         else:
-            self._embeddings_matrix = np.vstack([self._embeddings_matrix, embedding])
+            self._embeddings_matrix = np.vstack([self._embeddings_matrix, row])
 
         if len(self._cache) > self.max_entries:
-            self._cache.sort(key=lambda e: e.last_hit, reverse=True)
-            self._cache = self._cache[:self.max_entries]
-            self._embeddings_matrix = np.array([e.embedding for e in self._cache])
+            # Evict only the least recently hit entries (later position loses ties)
+            evict_count = len(self._cache) - self.max_entries
+            victims = set(heapq.nsmallest(
+                evict_count, range(len(self._cache)), key=lambda i: (self._cache[i].last_hit, -i)
+            ))
+            keep_mask = np.array([i not in victims for i in range(len(self._cache))])
+            self._cache = [e for e, keep in zip(self._cache, keep_mask) if keep]
+            self._embeddings_matrix = self._embeddings_matrix[keep_mask]
 
-        await self._save_cache()
+        self._schedule_save()
 
     async def _load_cache(self):
         """Load user-learned cache from disk."""
@@ -385,28 +423,44 @@ class SemanticCacheCapability(Capability):
                 try: self._cache.append(CacheEntry(**item))
                 except (TypeError, KeyError, ValueError): continue
             if self._cache:
-                self._embeddings_matrix = np.array([e.embedding for e in self._cache])
+                self._embeddings_matrix = self._normalize_rows(np.array([e.embedding for e in self._cache], dtype=np.float32))
                 self._embedding_dim = self._embeddings_matrix.shape[1]
             self._loaded = True
         except Exception: self._loaded = True
 
+    def _schedule_save(self):
+        """Coalesce cache writes into one save after SAVE_DELAY seconds."""
+        if self._save_handle is None:
+            self._save_handle = asyncio.get_running_loop().call_later(SAVE_DELAY, self._flush_save)
+
+    def _flush_save(self):
+        """Run the pending cache write (timer callback)."""
+        self._save_handle = None
+        self.hass.async_create_task(self._save_cache())
+
     async def _save_cache(self):
         """Persist cache to disk."""
         user_entries = [e for e in self._cache if not getattr(e, 'generated', False)]
         data = {"version": 5, "entries": [asdict(e) for e in user_entries], "stats": self._stats}
         try:
             def _write():
-                with open(self._cache_file, "w") as f: json.dump(data, f, indent=2)
+                # Compact separators: the file is mostly embedding floats, indentation doubled it
+                with open(self._cache_file, "w") as f: json.dump(data, f, separators=(",", ":"))
             await self.hass.async_add_executor_job(_write)
         except Exception as e: _LOGGER.error("[SemanticCache] Save failed: %s", e)
 
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """Scale each row to unit length (the embeddings matrix is kept normalized)."""
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / (norms + 1e-10)
+
     def _cosine_similarity(self, query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """Cosine similarity of a query against a row-normalized matrix."""
         if matrix is None or len(matrix) == 0: return np.array([], dtype=np.float32)
         q = query.flatten()
         q_norm = q / (np.linalg.norm(q) + 1e-10)
-        m_norms = np.linalg.norm(matrix, axis=1, keepdims=True)
-        m_norm = matrix / (m_norms + 1e-10)
-        return np.dot(m_norm, q_norm)
+        return np.dot(matrix, q_norm)
 
     def _normalize_numeric_value(self, text: str) -> tuple:
         from ..utils.german_utils import normalize_for_cache
@@ -142,7 +142,7 @@ class StepControlCapability(Capability):
         if domain == "light":
             # Light brightness is 0-255, convert to percentage
             raw_value = state.attributes.get(attribute, 0) or 0
-            current_pct = int((raw_value / 255.0) * 100)
+            current_pct = int(raw_value) * 100 // 255
         elif domain == "cover":
             # Cover position is already 0-100 (but 0=closed, 100=open)
             current_pct = state.attributes.get("current_position", 0) or 0
@@ -163,14 +163,14 @@ class StepControlCapability(Capability):
                 step_applied = off_to_on
             else:
                 # Calculate percentage-based step
-                step_applied = max(min_step, int(current_pct * step_percent / 100))
+                step_applied = max(min_step, int(current_pct * step_percent // 100))
                 new_pct = min(100, current_pct + step_applied)
         else:  # step_down
             if is_off or current_pct == 0:
                 # Already off, nothing to do
                 return {}
             
-            step_applied = max(min_step, int(current_pct * step_percent / 100))
+            step_applied = max(min_step, int(current_pct * step_percent // 100))
             new_pct = max(0, current_pct - step_applied)
         
         return {
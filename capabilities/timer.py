@@ -101,7 +101,7 @@ If no clear purpose is mentioned, return an empty string.""",
                 desc = result.get("description", "").strip()
                 return desc[:30] if desc else ""  # Limit for Android
         except Exception as e:
-            _LOGGER.debug(f"Failed to extract timer description: {e}")
+            _LOGGER.debug("Failed to extract timer description: %s", e)
         return ""
     
     async def _validate_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -145,5 +145,5 @@ IMPORTANT: Always output room and floor names in the user's original language.""
             if result and isinstance(result, dict):
                 return result
         except Exception as e:
-            _LOGGER.debug(f"Failed to extract vacuum details: {e}")
+            _LOGGER.debug("Failed to extract vacuum details: %s", e)
         return {}
\ No newline at end of file
@@ -40,11 +40,8 @@ def _extract_nouns(keywords_dict: Dict[str, str]) -> List[str]:
     
     E.g., {"das licht": "die lichter"} -> ["licht", "lichter"]
     """
-    nouns = []
-    for key, value in keywords_dict.items():
-        nouns.append(key.split()[-1])   # Last word of key
-        nouns.append(value.split()[-1]) # Last word of value
-    return nouns
+    # Last word of each key (singular) and value (plural)
+    return [word.rpartition(" ")[2] for pair in keywords_dict.items() for word in pair]
 
 
 def _get_name_de(keywords_dict: Dict[str, str]) -> str:
@@ -116,12 +116,12 @@ AUTOMATION_KEYWORDS: List[str] = [
 # Auto-derived from keyword dictionaries - extracts nouns from "article noun" format
 def _extract_nouns(keywords_dict: Dict[str, str]) -> Set[str]:
     """Extract all nouns (singular and plural) from a keywords dict."""
-    nouns = set()
-    for singular, plural in keywords_dict.items():
-        # Extract noun from "article noun" format
-        nouns.add(singular.split()[-1].lower())  # e.g. "der rollladen" -> "rollladen"
-        nouns.add(plural.split()[-1].lower())    # e.g. "die rollläden" -> "rollläden"
-    return nouns
+    # Extract noun from "article noun" format, e.g. "der rollladen" -> "rollladen"
+    return {
+        word.rpartition(" ")[2].lower()
+        for pair in keywords_dict.items()
+        for word in pair
+    }
 
 GENERIC_NAMES: Set[str] = (
     _extract_nouns(LIGHT_KEYWORDS) |
@@ -17,6 +17,7 @@ Usage:
     # Returns: "Das habe ich nicht gefunden."
 """
 
+import re
 from typing import Dict, List, Optional, Set
 
 
@@ -707,6 +708,27 @@ DOMAIN_RESPONSES: Dict[str, Dict[str, List[str]]] = {
 }
 
 
+# Map of common singular -> plural verb forms for common smart home domains
+_PLURAL_VERBS = {
+    "ist": "sind",
+    "wurde": "wurden",
+    "läuft": "laufen",
+    "leuchtet": "leuchten",
+    "heizt": "heizen",
+    "macht": "machen",
+    "kümmert sich": "kümmern sich",
+    "schließt": "schließen",
+    "öffnet": "öffnen",
+    "geht": "gehen",
+    "steht": "stehen",
+    "fährt": "fahren",
+}
+# One pass over the message instead of a re.sub per verb
+_PLURAL_VERB_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, _PLURAL_VERBS)) + r")\b", re.IGNORECASE
+)
+
+
 def get_domain_confirmation(
     domain: str,
     action: str,
@@ -758,32 +780,22 @@ def get_domain_confirmation(
             action_suffix=action_suffix,
         )
         if is_plural:
-            import re
-            
-            # Map of common singular -> plural verb forms for common smart home domains
-            PLURAL_REPLACEMENTS = {
-                r"\bist\b": "sind",
-                r"\bwurde\b": "wurden",
-                r"\bläuft\b": "laufen",
-                r"\bleuchtet\b": "leuchten",
-                r"\bheizt\b": "heizen",
-                r"\bmacht\b": "machen",
-                r"\bkümmert sich\b": "kümmern sich",
-                r"\bschließt\b": "schließen",
-                r"\böffnet\b": "öffnen",
-                r"\bgeht\b": "gehen",
-                r"\bsteht\b": "stehen",
-                r"\bfährt\b": "fahren",
-            }
-            
-            for pattern, replacement in PLURAL_REPLACEMENTS.items():
-                msg = re.sub(pattern, replacement, msg, flags=re.IGNORECASE)
+            msg = _PLURAL_VERB_RE.sub(lambda m: _PLURAL_VERBS[m.group(0).lower()], msg)
                 
         return msg
     except KeyError:
         return f"{name} erledigt."
 
 
+_DOT_TO_COMMA = str.maketrans(".", ",")
+# Finite numbers in float()'s own syntax (sign, "_" digit groups, exponent);
+# anything else is formatted as text
+_DIGITS = r"[0-9](?:_?[0-9])*"
+_NUMBER_RE = re.compile(
+    rf"\s*[+-]?(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?\s*"
+)
+
+
 def _format_value_de(value: str, domain: str, action: str) -> str:
     """Format a value for German locale.
     
@@ -793,6 +805,11 @@ def _format_value_de(value: str, domain: str, action: str) -> str:
     if not value:
         return value
     
+    value = str(value)
+    # Words like "step_up" or "5 Minuten" skip the float() attempt and its exception
+    if not _NUMBER_RE.fullmatch(value):
+        return value.translate(_DOT_TO_COMMA)
+    
     try:
         num = float(value)
         
@@ -804,10 +821,10 @@ def _format_value_de(value: str, domain: str, action: str) -> str:
         if num == int(num):
             return str(int(num))
         else:
-            return str(num).replace(".", ",")
-    except (ValueError, TypeError):
+            return str(num).translate(_DOT_TO_COMMA)
+    except (ValueError, TypeError, OverflowError):
         # Not a number, return as-is
-        return str(value).replace(".", ",")
+        return value.translate(_DOT_TO_COMMA)
 # --- Stage 3 Cloud Prompt ---
 SYSTEM_PROMPT_STAGE3 = """Du bist die intelligente Zentrale eines Home Assistant Smart Homes. 
 Deine Aufgabe ist es, Nutzeranfragen präzise zu verstehen und entweder direkt zu beantworten oder durch den Einsatz deiner Werkzeuge (Tools) die nötigen Informationen zu beschaffen oder Aktionen auszuführen.
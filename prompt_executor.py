@@ -162,13 +162,15 @@ class PromptExecutor:
     ) -> dict[str, Any] | list | None:
         ip, port, model = _get_stage_config(self.config, stage)
         client = OllamaClient(ip, port)
+        # Serialize the variables once; both attempts send the same user message
+        user_content = json.dumps(context, ensure_ascii=False)
         
         # 1. First attempt: Native JSON Schema (Structured Outputs)
         try:
             resp_text = await client.chat(
                 model,
                 system_prompt,
-                json.dumps(context, ensure_ascii=False),
+                user_content,
                 temperature=temperature,
                 format=schema,
             )
@@ -185,7 +187,7 @@ class PromptExecutor:
             resp_text = await client.chat(
                 model,
                 system_prompt,
-                json.dumps(context, ensure_ascii=False),
+                user_content,
                 temperature=temperature,
                 format="json",
             )
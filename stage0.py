@@ -50,10 +50,10 @@ class Stage0Processor(BaseStage):
     }
     
     # Keys that are for resolution only, not execution params
-    RESOLUTION_KEYS = {
+    RESOLUTION_KEYS = frozenset({
         "area", "room", "floor", "name", "entity",
         "device", "label", "domain", "device_class", "entity_id",
-    }
+    })
 
     async def _dry_run_recognize(self, user_input: conversation.ConversationInput):
         """Run NLU recognition without executing the intent."""
@@ -137,7 +137,7 @@ class Stage0Processor(BaseStage):
             _LOGGER.debug("[Stage0] Injecting constraints: %s", implications)
             norm_entities.update(implications)
 
-        if norm_entities:
+        if norm_entities and _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("[Stage0] NLU entities keys=%s", list(norm_entities.keys()))
 
         # 3. Entity resolution
@@ -70,14 +70,17 @@ class Stage1CacheProcessor(BaseStage):
         text = user_input.text
         words = text.lower().split()
 
-        memory_cap = self.get("knowledge_graph")
+        # Fetch the alias table once instead of awaiting a lookup per word
+        aliases = await self.get("knowledge_graph").get_area_aliases()
+        if not aliases:
+            return user_input
         
         for word in words:
             clean_word = word.strip(".,!?")
             if not clean_word:
                 continue
 
-            normalized = await memory_cap.get_area_alias(clean_word)
+            normalized = aliases.get(clean_word)
             if normalized:
                 _LOGGER.debug("[Stage1Cache] Alias: '%s' → '%s'", clean_word, normalized)
                 pattern = re.compile(re.escape(clean_word), re.IGNORECASE)
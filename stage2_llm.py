@@ -10,6 +10,7 @@ Flow:
 4. Return StageResult.success if resolved, otherwise escalate to Stage3
 """
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -79,12 +80,6 @@ class Stage2LLMProcessor(BaseStage):
         _LOGGER.debug("[Stage2LLM] Input='%s'", user_input.text)
 
 
-        # 1. Build environment context for the LLM
-        # Use keywords from the utterance as hints for context pruning
-        hints = [word for word in user_input.text.split() if len(word) > 2]
-        env_context = await self.get("prompt_context").get_context(hints=hints)
-
-        # 2. Get prompt components
         # 1. Get clarified commands from Stage1 or run clarification ourselves
         clarified_commands = context.get("commands", [])
         
@@ -149,8 +144,9 @@ class Stage2LLMProcessor(BaseStage):
                     raw_text=user_input.text,
                 )
 
-        _LOGGER.debug("[Stage2LLM] Intent='%s', domain='%s', slots=%s", 
-                     intent_name, domain, list(slots.keys()))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("[Stage2LLM] Intent='%s', domain='%s', slots=%s",
+                          intent_name, domain, list(slots.keys()))
 
         # 3. Resolve area aliases if present
         if slots.get("area"):
@@ -280,14 +276,16 @@ class Stage2LLMProcessor(BaseStage):
         all_intents: List[str] = []
         merged_params: Dict[str, Any] = {}
         
-        for cmd in commands:
+        # Parse all atomic commands concurrently; the LLM round-trips don't depend on each other
+        cmd_inputs = [with_new_text(original_input, cmd) for cmd in commands]
+        ki_results = await asyncio.gather(
+            *(self.use("keyword_intent", cmd_input) for cmd_input in cmd_inputs)
+        )
+
+        for cmd, cmd_input, ki_data in zip(commands, cmd_inputs, ki_results):
             _LOGGER.debug("[Stage2LLM] Processing atomic command: '%s'", cmd)
             
-            # Create modified input with atomic command
-            cmd_input = with_new_text(original_input, cmd)
-            
-            # Process through keyword_intent
-            ki_data = await self.use("keyword_intent", cmd_input) or {}
+            ki_data = ki_data or {}
             intent_name = ki_data.get("intent")
             slots = ki_data.get("slots") or {}
             domain = ki_data.get("domain")
@@ -65,6 +65,23 @@ class TestLevenshteinDistance:
     def test_german_umlauts(self):
         assert levenshtein_distance("küche", "kuche") == 1
 
+    def test_rapidfuzz_matches_pure_python(self):
+        from rapidfuzz.distance import Levenshtein
+
+        pairs = [("lihct", "licht"), ("rolläden", "rollläden"), ("abc", ""), ("küche", "kuche")]
+        expected = [levenshtein_distance(a, b) for a, b in pairs]
+        with patch("multistage_assist.utils.fuzzy_utils._levenshtein", Levenshtein):
+            assert [levenshtein_distance(a, b) for a, b in pairs] == expected
+
+    def test_score_cutoff_caps_distance(self):
+        from rapidfuzz.distance import Levenshtein
+
+        assert levenshtein_distance("licht", "lampe", score_cutoff=2) == 3
+        assert levenshtein_distance("lihct", "licht", score_cutoff=2) == 2
+        with patch("multistage_assist.utils.fuzzy_utils._levenshtein", Levenshtein):
+            assert levenshtein_distance("licht", "lampe", score_cutoff=2) == 3
+            assert levenshtein_distance("lihct", "licht", score_cutoff=2) == 2
+
 
 class TestNormalizeForFuzzy:
     """Tests for text normalization."""
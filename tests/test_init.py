@@ -8,7 +8,7 @@ from homeassistant.config_entries import ConfigEntry
 
 # Import the integration
 # We need to import it as a module to support relative imports within it
-from multistage_assist import async_setup_entry, async_unload_entry, DOMAIN
+from multistage_assist import async_setup_entry, async_unload_entry, DOMAIN, EVENT_CALL_SERVICE
 
 
 async def test_setup_entry(hass, config_entry, mock_conversation):
@@ -34,11 +34,42 @@ async def test_setup_entry(hass, config_entry, mock_conversation):
         # Verify update listener was added
         config_entry.add_update_listener.assert_called_once()
 
+        # Pending knowledge graph writes are flushed when the entry unloads
+        from multistage_assist.capabilities.knowledge_graph import KnowledgeGraphCapability
+        config_entry.async_on_unload.assert_any_call(KnowledgeGraphCapability.async_flush_all)
+
+        # Cached script fields are dropped when scripts are reloaded; compare against the
+        # event type __init__ imported, which the HA mocks may not share with this module
+        from multistage_assist.capabilities.intent_executor import IntentExecutorCapability
+        hass.bus.async_listen.assert_any_call(
+            EVENT_CALL_SERVICE,
+            IntentExecutorCapability.async_clear_script_fields,
+            event_filter=IntentExecutorCapability.is_script_reload,
+        )
+
         # Verify data stored in hass
         assert DOMAIN in hass.data
         assert hass.data[DOMAIN][config_entry.entry_id] == config_entry.data
 
 
+async def test_setup_entry_flushes_semantic_cache_on_unload(hass, config_entry, mock_conversation):
+    """Test that the semantic cache shutdown is tied to the entry lifecycle."""
+    hass.async_create_task = MagicMock()
+    with patch(
+        "multistage_assist.conversation.MultiStageAssistAgent"
+    ) as mock_agent_cls:
+        cache = MagicMock()
+        stage1 = MagicMock()
+        stage1.has.return_value = True
+        stage1.get.return_value = cache
+        mock_agent_cls.return_value.stages = [MagicMock(), stage1]
+
+        assert await async_setup_entry(hass, config_entry)
+
+    config_entry.async_on_unload.assert_any_call(cache.async_shutdown)
+    assert hass.bus.async_listen_once.call_args.args[1] is cache.async_shutdown
+
+
 async def test_unload_entry(hass, config_entry, mock_conversation):
     """Test unloading the integration."""
     # Setup first
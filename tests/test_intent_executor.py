@@ -3,13 +3,22 @@
 Tests verification polling, German state translations, and execution logic.
 """
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from homeassistant.helpers import intent
 
 from multistage_assist.capabilities.intent_executor import IntentExecutorCapability
 
 
+@pytest.fixture(autouse=True)
+def clear_script_fields_cache():
+    """Script field lookups are cached on the class; start each test without them."""
+    IntentExecutorCapability._script_list_support.clear()
+    yield
+    IntentExecutorCapability._script_list_support.clear()
+
+
 # ============================================================================
 # VERIFICATION POLLING TESTS
 # ============================================================================
@@ -275,6 +284,465 @@ async def test_state_query_media_playing(hass, config_entry):
             assert "playing" not in speech.lower()  # Should be translated
 
 
+async def test_all_question_names_non_matching_entity(hass, config_entry):
+    """Test that 'Sind alle Lichter an?' names the entity that is still off."""
+    executor = IntentExecutorCapability(hass, config_entry.data)
+
+    hass.states.set("light.a", "on", {"friendly_name": "Licht A"})
+    hass.states.set("light.b", "off", {"friendly_name": "Licht B"})
+
+    user_input = MagicMock()
+    user_input.text = "Sind alle Lichter an?"
+    user_input.conversation_id = "test"
+    user_input.language = "de"
+
+    with patch("homeassistant.helpers.intent.async_handle") as mock_handle:
+        mock_resp = intent.IntentResponse(language="de")
+        mock_resp.async_set_speech("")
+        mock_handle.return_value = mock_resp
+
+        result = await executor.run(
+            user_input,
+            intent_name="HassGetState",
+            entity_ids=["light.a", "light.b"],
+            params={"state": "on"},
+        )
+
+    speech = result["result"].response.speech["plain"]["speech"]
+    assert speech == "Nein, Licht B ist noch aus."
+
+
+@pytest.mark.parametrize("command", ["on", "an"])
+async def test_temporary_control_on_command_maps_to_on(hass, config_entry, command):
+    """Test that both LLM ('on') and German ('an') commands timebox to 'on'."""
+    executor = IntentExecutorCapability(hass, config_entry.data)
+
+    hass.states.set("light.a", "off", {"friendly_name": "Licht A"})
+
+    user_input = MagicMock()
+    user_input.text = "Licht A für 5 Minuten an"
+    user_input.conversation_id = "test"
+    user_input.language = "de"
+
+    with patch.object(executor, "_check_script_exists", return_value=True):
+        await executor.run(
+            user_input,
+            intent_name="TemporaryControl",
+            entity_ids=["light.a"],
+            params={"command": command, "duration": "5 Minuten"},
+        )
+
+    script_calls = [c for c in hass.service_calls if c["domain"] == "script"]
+    assert script_calls[0]["service_data"]["action"] == "on"
+
+
+@pytest.mark.parametrize(
+    "fields, expected_calls",
+    [
+        ({"target_entity": {}, "target_entities": {}}, [{"target_entities": ["light.a", "light.b"]}]),
+        # Script installed before target_entities existed: one run per entity
+        ({"target_entity": {}}, [{"target_entity": "light.a"}, {"target_entity": "light.b"}]),
+    ],
+)
+async def test_temporary_control_batches_only_when_script_supports_it(
+    hass, config_entry, fields, expected_calls
+):
+    """Test that several timeboxed entities share a run only with an up-to-date script."""
+    executor = IntentExecutorCapability(hass, config_entry.data)
+
+    hass.states.set("light.a", "off", {"friendly_name": "Licht A"})
+    hass.states.set("light.b", "off", {"friendly_name": "Licht B"})
+
+    user_input = MagicMock()
+    user_input.text = "Lichter für 5 Minuten an"
+    user_input.conversation_id = "test"
+    user_input.language = "de"
+
+    descriptions = {"script": {"timebox_entity_state": {"fields": fields}}}
+    with patch.object(executor, "_check_script_exists", return_value=True), \
+         patch("multistage_assist.capabilities.intent_executor.async_get_all_descriptions",
+               AsyncMock(return_value=descriptions)):
+        await executor.run(
+            user_input,
+            intent_name="TemporaryControl",
+            entity_ids=["light.a", "light.b"],
+            params={"command": "on", "duration": "5 Minuten"},
+        )
+
+    script_calls = [c for c in hass.service_calls if c["domain"] == "script"]
+    assert [
+        {k: v for k, v in c["service_data"].items() if k.startswith("target_")}
+        for c in script_calls
+    ] == expected_calls
+    assert all(c["service_data"]["action"] == "on" for c in script_calls)
+
+
+async def test_light_set_zero_brightness_is_timeboxed(hass, config_entry):
+    """Test that brightness 0 is treated as a value, not as a missing slot."""
+    executor = IntentExecutorCapability(hass, config_entry.data)
+
+    hass.states.set("light.a", "on", {"friendly_name": "Licht A", "brightness": 255})
+
+    user_input = MagicMock()
+    user_input.text = "Licht A für 5 Minuten auf 0 Prozent"
+    user_input.conversation_id = "test"
+    user_input.language = "de"
+
+    with patch.object(executor, "_check_script_exists", return_value=True):
+        await executor.run(
+            user_input,
+            intent_name="HassLightSet",
+            entity_ids=["light.a"],
+            params={"brightness": 0, "duration": "5 Minuten"},
+        )
+
+    script_calls = [c for c in hass.service_calls if c["domain"] == "script"]
+    assert script_calls[0]["service_data"]["value"] == 0
+
+
+async def test_light_step_patches_only_rewritten_slots(hass, config_entry):
+    """Test that step_up sends the computed brightness and keeps shared slots."""
+    executor = IntentExecutorCapability(hass, config_entry.data)
+
+    hass.states.set("light.a", "on", {"friendly_name": "Licht A", "brightness": 128})
+
+    user_input = MagicMock()
+    user_input.text = "Mach das Licht heller"
+    user_input.conversation_id = "test"
+    user_input.language = "de"
+
+    with patch("homeassistant.helpers.intent.async_handle") as mock_handle, \
+         patch.object(executor, "_verify_execution", return_value=True):
+        mock_handle.return_value = intent.IntentResponse(language="de")
+        await executor.run(
+            user_input,
+            intent_name="HassLightSet",
+            entity_ids=["light.a"],
+            params={"command": "step_up", "area": "Küche", "color": "rot"},
+        )
+
+    slots = mock_handle.call_args.kwargs["slots"]
+    assert slots["brightness"] == {"value": 67}
+    assert slots["color"] == {"value": "rot"}
+    assert "area" not in slots
+
+
+async def test_delayed_control_batches_entities_into_one_script_call(hass, config_entry):
+    """Test that a delayed action on several entities runs the script once."""
+    executor = IntentExecutorCapability(hass, config_entry.data)
+
+    hass.states.set("light.a", "on", {"friendly_name": "Licht A"})
+    hass.states.set("light.b", "on", {"friendly_name": "Licht B"})
+
+    user_input = MagicMock()
+    user_input.text = "Schalte die Lichter in 5 Minuten aus"
+    user_input.conversation_id = "test"
+    user_input.language = "de"
+
+    descriptions = {"script": {"delay_action": {"fields": {"target_entities": {}}}}}
+    with patch.object(executor, "_check_script_exists", return_value=True), \
+         patch("multistage_assist.capabilities.intent_executor.async_get_all_descriptions",
+               AsyncMock(return_value=descriptions)):
+        await executor.run(
+            user_input,
+            intent_name="DelayedControl",
+            entity_ids=["light.a", "light.b"],
+            params={"command": "off", "delay": "5 Minuten"},
+        )
+
+    script_calls = [c for c in hass.service_calls if c["domain"] == "script"]
+    assert len(script_calls) == 1
+    assert script_calls[0]["service"] == "delay_action"
+    assert script_calls[0]["service_data"]["target_entities"] == ["light.a", "light.b"]
+    assert script_calls[0]["service_data"]["action"] == "off"
+
+
+async def test_delayed_control_calls_older_script_per_entity(hass, config_entry):
+    """Test that a delay_action install without target_entities gets one run per entity."""
+    executor = IntentExecutorCapability(hass, config_entry.data)
+
+    hass.states.set("light.a", "on", {"friendly_name": "Licht A"})
+    hass.states.set("light.b", "on", {"friendly_name": "Licht B"})
+
+    user_input = MagicMock()
+    user_input.text = "Schalte die Lichter in 5 Minuten aus"
+    user_input.conversation_id = "test"
+    user_input.language = "de"
+
+    descriptions = {"script": {"delay_action": {"fields": {"target_entity": {}}}}}
+    with patch.object(executor, "_check_script_exists", return_value=True), \
+         patch("multistage_assist.capabilities.intent_executor.async_get_all_descriptions",
+               AsyncMock(return_value=descriptions)):
+        await executor.run(
+            user_input,
+            intent_name="DelayedControl",
+            entity_ids=["light.a", "light.b"],
+            params={"command": "off", "delay": "5 Minuten"},
+        )
+
+    script_calls = [c for c in hass.service_calls if c["domain"] == "script"]
+    assert [c["service_data"]["target_entity"] for c in script_calls] == ["light.a", "light.b"]
+    assert all("target_entities" not in c["service_data"] for c in script_calls)
+
+
+async def test_script_batch_keeps_input_order(hass, config_entry):
+    """Test that batched entities are sent in input order, not completion order."""
+    executor = IntentExecutorCapability(hass, config_entry.data)
+
+    hass.states.set("light.a", "on", {"friendly_name": "Licht A"})
+    hass.states.set("light.b", "on", {"friendly_name": "Licht B"})
+
+    user_input = MagicMock()
+    user_input.text = "Schalte die Lichter in 5 Minuten aus"
+    user_input.conversation_id = "test"
+    user_input.language = "de"
+
+    # light.a finishes last, so it is queued after light.b
+    handle_entity = executor._handle_entity
+
+    async def light_a_last(entity_run, eid, *args):
+        if eid == "light.a":
+            await asyncio.sleep(0.01)
+        return await handle_entity(entity_run, eid, *args)
+
+    descriptions = {"script": {"delay_action": {"fields": {"target_entities": {}}}}}
+    with patch.object(executor, "_check_script_exists", return_value=True), \
+         patch.object(executor, "_handle_entity", side_effect=light_a_last), \
+         patch("multistage_assist.capabilities.intent_executor.async_get_all_descriptions",
+               AsyncMock(return_value=descriptions)):
+        await executor.run(
+            user_input,
+            intent_name="DelayedControl",
+            entity_ids=["light.a", "light.b"],
+            params={"command": "off", "delay": "5 Minuten"},
+        )
+
+    script_calls = [c for c in hass.service_calls if c["domain"] == "script"]
+    assert script_calls[0]["service_data"]["target_entities"] == ["light.a", "light.b"]
+
+
+async def test_cancelled_entity_dispatch_does_not_abort_run(hass, config_entry):
+    """Test that one cancelled entity is skipped while the others still answer."""
+    executor = IntentExecutorCapability(hass, config_entry.data)
+
+    hass.states.set("light.a", "off", {"friendly_name": "Licht A"})
+    hass.states.set("light.b", "off", {"friendly_name": "Licht B"})
+
+    user_input = MagicMock()
+    user_input.text = "Schalte die Lichter an"
+    user_input.conversation_id = "test"
+    user_input.language = "de"
+
+    async def handle(hass, **kwargs):
+        name = kwargs["slots"]["name"]["value"]
+        if name == "light.b":
+            raise asyncio.CancelledError
+        resp = intent.IntentResponse(language="de")
+        resp.async_set_speech(name)
+        return resp
+
+    with patch("homeassistant.helpers.intent.async_handle", side_effect=handle), \
+         patch.object(executor, "_verify_execution", return_value=True):
+        result = await executor.run(
+            user_input,
+            intent_name="HassTurnOn",
+            entity_ids=["light.a", "light.b"],
+            params={},
+        )
+
+    assert result["result"].response.speech["plain"]["speech"] == "light.a"
+
+
+async def test_script_batch_starts_before_verification(hass, config_entry):
+    """Test that queued script runs are sent before other entities' state checks."""
+    executor = IntentExecutorCapability(hass, config_entry.data)
+
+    hass.states.set("light.a", "off", {"friendly_name": "Licht A"})
+    hass.states.set("light.b", "off", {"friendly_name": "Licht B"})
+
+    user_input = MagicMock()
+    user_input.text = "Schalte die Lichter für 5 Minuten an"
+    user_input.conversation_id = "test"
+    user_input.language = "de"
+
+    # Only light.a is timeboxed; light.b is switched and verified normally
+    timebox = executor._handle_timebox_or_delay
+
+    def timebox_first(intent_name, eid, *args):
+        return timebox(intent_name, eid, *args) if eid == "light.a" else None
+
+    scripts_at_verify = []
+
+    async def verify(*args, **kwargs):
+        scripts_at_verify.append(
+            [c["service_data"] for c in hass.service_calls if c["domain"] == "script"]
+        )
+        return True
+
+    with patch("homeassistant.helpers.intent.async_handle") as mock_handle, \
+         patch.object(executor, "_check_script_exists", return_value=True), \
+         patch.object(executor, "_handle_timebox_or_delay", side_effect=timebox_first), \
+         patch.object(executor, "_verify_execution", side_effect=verify):
+        mock_handle.return_value = intent.IntentResponse(language="de")
+        result = await executor.run(
+            user_input,
+            intent_name="HassTurnOn",
+            entity_ids=["light.a", "light.b"],
+            params={"duration": "5 Minuten"},
+        )
+
+    assert len(scripts_at_verify) == 1
+    assert [d["target_entity"] for d in scripts_at_verify[0]] == ["light.a"]
+    assert result["verification_failures"] == []
+
+
+async def test_script_fields_are_cached_until_scripts_reload(hass, config_entry):
+    """Test that script fields are read once and re-read after a script reload."""
+    executor = IntentExecutorCapability(hass, config_entry.data)
+    get_descriptions = AsyncMock(
+        return_value={"script": {"delay_action": {"fields": {"target_entities": {}}}}}
+    )
+
+    with patch(
+        "multistage_assist.capabilities.intent_executor.async_get_all_descriptions",
+        get_descriptions,
+    ):
+        assert await executor._script_accepts_entity_list("delay_action")
+        assert await executor._script_accepts_entity_list("delay_action")
+        assert get_descriptions.await_count == 1
+
+        # Only script.reload passes the event filter
+        assert not IntentExecutorCapability.is_script_reload(
+            {"domain": "light", "service": "turn_on"}
+        )
+        reload = {"domain": "script", "service": "reload"}
+        assert IntentExecutorCapability.is_script_reload(reload)
+        assert IntentExecutorCapability.is_script_reload(MagicMock(data=reload))
+
+        get_descriptions.return_value = {"script": {"delay_action": {"fields": {}}}}
+        IntentExecutorCapability.async_clear_script_fields(MagicMock(data=reload))
+        assert not await executor._script_accepts_entity_list("delay_action")
+        assert get_descriptions.await_count == 2
+
+
+async def test_multi_entity_dispatch_runs_concurrently(hass, config_entry):
+    """Test that per-entity execution and verification overlap."""
+    executor = IntentExecutorCapability(hass, config_entry.data)
+
+    hass.states.set("light.a", "off", {"friendly_name": "Licht A"})
+    hass.states.set("light.b", "off", {"friendly_name": "Licht B"})
+
+    user_input = MagicMock()
+    user_input.text = "Schalte alle Lichter an"
+    user_input.conversation_id = "test"
+    user_input.language = "de"
+
+    in_flight = 0
+    peak = 0
+
+    async def tracked_verify(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return True
+
+    with patch("homeassistant.helpers.intent.async_handle") as mock_handle, \
+         patch.object(executor, "_verify_execution", side_effect=tracked_verify):
+        mock_resp = intent.IntentResponse(language="de")
+        mock_resp.async_set_speech("Lichter eingeschaltet.")
+        mock_handle.return_value = mock_resp
+
+        result = await executor.run(
+            user_input,
+            intent_name="HassTurnOn",
+            entity_ids=["light.a", "light.b"],
+            params={},
+        )
+
+    assert mock_handle.call_count == 2
+    assert result["verification_failures"] == []
+    # Sequential verification would never have both entities in flight
+    assert peak == 2
+
+
+async def test_multi_entity_dispatch_respects_concurrency_cap(hass, config_entry):
+    """Test that no more than MAX_PARALLEL_ENTITIES entities run at once."""
+    executor = IntentExecutorCapability(hass, config_entry.data)
+    executor.MAX_PARALLEL_ENTITIES = 2
+
+    entity_ids = [f"light.l{i}" for i in range(5)]
+    for eid in entity_ids:
+        hass.states.set(eid, "off", {"friendly_name": eid})
+
+    user_input = MagicMock()
+    user_input.text = "Schalte alle Lichter an"
+    user_input.conversation_id = "test"
+    user_input.language = "de"
+
+    in_flight = 0
+    peak = 0
+
+    async def tracked_verify(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return True
+
+    with patch("homeassistant.helpers.intent.async_handle") as mock_handle, \
+         patch.object(executor, "_verify_execution", side_effect=tracked_verify):
+        mock_resp = intent.IntentResponse(language="de")
+        mock_resp.async_set_speech("Lichter eingeschaltet.")
+        mock_handle.return_value = mock_resp
+
+        await executor.run(
+            user_input,
+            intent_name="HassTurnOn",
+            entity_ids=entity_ids,
+            params={},
+        )
+
+    assert mock_handle.call_count == 5
+    assert peak == 2
+
+
+async def test_mixed_domain_dispatch_keeps_input_order(hass, config_entry):
+    """Test that entities of different domains are handled and answered in input order."""
+    executor = IntentExecutorCapability(hass, config_entry.data)
+
+    entity_ids = ["light.a", "switch.b", "light.c"]
+    for eid in entity_ids:
+        hass.states.set(eid, "off", {"friendly_name": eid})
+
+    user_input = MagicMock()
+    user_input.text = "Schalte alles an"
+    user_input.conversation_id = "test"
+    user_input.language = "de"
+
+    async def handle(hass, **kwargs):
+        resp = intent.IntentResponse(language="de")
+        resp.async_set_speech(kwargs["slots"]["name"]["value"])
+        return resp
+
+    with patch("homeassistant.helpers.intent.async_handle", side_effect=handle) as mock_handle, \
+         patch.object(executor, "_verify_execution", return_value=True):
+        result = await executor.run(
+            user_input,
+            intent_name="HassTurnOn",
+            entity_ids=entity_ids,
+            params={},
+        )
+
+    slots = [c.kwargs["slots"] for c in mock_handle.call_args_list]
+    assert [s["name"]["value"] for s in slots] == entity_ids
+    assert [s["domain"]["value"] for s in slots] == ["light", "switch", "light"]
+    # The last requested entity's response answers the run
+    assert result["result"].response.speech["plain"]["speech"] == "light.c"
+
+
 # ============================================================================
 # TEMPORARY CONTROL TESTS (Skipped - require complex HA mocking)
 # ============================================================================
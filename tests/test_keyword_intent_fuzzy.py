@@ -1,5 +1,6 @@
 
 import pytest
+from unittest.mock import AsyncMock, MagicMock
 from multistage_assist.capabilities.keyword_intent import KeywordIntentCapability
 
 def test_fuzzy_match_strictness():
@@ -29,3 +30,78 @@ def test_fuzzy_match_strictness():
     # Test 4: Exact Match
     dist = ki._fuzzy_match_distance("licht", "licht")
     assert dist == 0
+
+
+def test_detect_domain_is_case_insensitive_and_memoized():
+    """Test that repeated utterances are served from the domain cache."""
+    ki = KeywordIntentCapability(hass=None, config={})
+    KeywordIntentCapability._detect_domain_lower.cache_clear()
+
+    assert ki._detect_domain("Schalte das LIHCT an") == "light"
+    assert ki._detect_domain("schalte das lihct an") == "light"
+    assert KeywordIntentCapability._detect_domain_lower.cache_info().hits == 1
+
+
+def test_detect_domain_short_keywords_do_not_match_inside_words():
+    """Test that short keywords end a word but long ones match in compounds."""
+    ki = KeywordIntentCapability(hass=None, config={})
+
+    assert ki._detect_domain("Schalte das Deckenlicht an") == "light"
+    assert ki._detect_domain("Schalte den Deckenspot an") == "light"
+    assert ki._detect_domain("Spiele Spotify ab") != "light"
+
+
+def test_detect_domain_accepts_transliterated_umlauts():
+    """Test that ASCII spellings of umlauts match the same domain."""
+    ki = KeywordIntentCapability(hass=None, config={})
+
+    assert ki._detect_domain("Fahre die Rolläden runter") == "cover"
+    assert ki._detect_domain("Fahre die Rolllaeden runter") == "cover"
+    assert ki._detect_domain("Schalte den Luefter an") == "fan"
+
+
+def test_detect_domain_skips_trivial_input():
+    """Test that empty or too-short input short-circuits detection."""
+    ki = KeywordIntentCapability(hass=None, config={})
+
+    assert ki._detect_domain("") is None
+    assert ki._detect_domain("  a ") is None
+    assert ki._detect_domain("Licht an " + "x" * 1000) == "light"
+
+
+async def test_run_rejects_malformed_llm_responses():
+    """Test that non-dict or intent-less responses yield an empty result."""
+    ki = KeywordIntentCapability(hass=None, config={})
+    user_input = MagicMock(text="Schalte das Licht an")
+
+    for bad in (None, ["HassTurnOn"], "HassTurnOn", {}, {"intent": ""}):
+        ki._safe_prompt = AsyncMock(return_value=bad)
+        assert await ki.run(user_input) == {}
+
+    ki._safe_prompt = AsyncMock(
+        return_value={"intent": "HassTurnOn", "slots": "kaputt", "area": "Küche", "name": "alle"}
+    )
+    result = await ki.run(user_input)
+    assert result["intent"] == "HassTurnOn"
+    assert result["slots"]["area"] == "Küche"
+    assert result["slots"]["domain"] == "light"
+
+
+def test_detect_domain_adjective_keywords_need_whole_words():
+    """Test that 'warm' only counts as a whole word, not inside 'Schwarm'."""
+    ki = KeywordIntentCapability(hass=None, config={})
+
+    assert ki._detect_domain("Ein Schwarm Bienen") != "sensor"
+    assert ki._detect_domain("Das Wasser ist lauwarm") != "sensor"
+    assert ki._detect_domain("Wie warm ist es im Bad") == "sensor"
+    assert ki._detect_domain("Sind es draußen 20 Grad") == "sensor"
+
+
+def test_detect_domain_unit_keywords_match_compound_tails():
+    """Test that 'wert'/'grad' still match as the tail of a compound word."""
+    ki = KeywordIntentCapability(hass=None, config={})
+
+    assert ki._detect_domain("Wie hoch ist der Messwert im Bad") == "sensor"
+    assert ki._detect_domain("Zeig mir den Sollwert") == "sensor"
+    assert ki._detect_domain("Wie ist der Feuchtewert") == "sensor"
+    assert ki._detect_domain("Es hat 20grad") == "sensor"
@@ -8,6 +8,7 @@ from multistage_assist.capabilities.knowledge_graph import (
     ActivationMode,
     Dependency,
     DependencyResolution,
+    SAVE_DELAY,
 )
 
 @pytest.fixture
@@ -126,6 +127,58 @@ class TestKnowledgeGraphCapability:
         # Case insensitive retrieval
         assert await capability.get_area_alias("BAD") == "Badezimmer"
 
+        # Whole table for per-word normalization
+        assert await capability.get_area_aliases() == {"bad": "Badezimmer"}
+        with pytest.raises(TypeError):
+            (await capability.get_area_aliases())["bad"] = "Bad"
+
+        # Writes are debounced through the store, not rewritten per alias
+        capability._store.async_save.assert_not_called()
+        data_func, delay = capability._store.async_delay_save.call_args.args
+        assert data_func()["areas"] == {"bad": "Badezimmer"}
+        assert delay == SAVE_DELAY
+
+        # Re-learning the same alias does not schedule another write
+        await capability.learn_area_alias("bad", "Badezimmer")
+        assert capability._store.async_delay_save.call_count == 1
+
+    async def test_reload_flushes_pending_save(self, hass, config):
+        """Test that an entry reload writes pending aliases before new instances load."""
+        disk = {}
+
+        class FakeStore:
+            """Shared on-disk data; delayed writes stay pending until the timer fires."""
+            def __init__(self):
+                self.pending = None
+
+            async def async_load(self):
+                return {k: dict(v) for k, v in disk.items()} or None
+
+            async def async_save(self, data):
+                self.pending = None
+                disk.update({k: dict(v) for k, v in data.items()})
+
+            def async_delay_save(self, data_func, delay=0):
+                self.pending = data_func
+
+        old = KnowledgeGraphCapability(hass, config)
+        old._store = FakeStore()
+        await old.learn_area_alias("bad", "Badezimmer")
+        assert disk == {} and old._store.pending is not None
+
+        # Entry unload, then the reloaded entry creates fresh instances
+        await KnowledgeGraphCapability.async_flush_all()
+        assert old._store.pending is None
+
+        new = KnowledgeGraphCapability(hass, config)
+        new._store = FakeStore()
+        assert await new.get_area_alias("bad") == "Badezimmer"
+
+        # Nothing pending any more, so a second flush does not write again
+        disk.clear()
+        await old.async_flush()
+        assert disk == {}
+
     async def test_personal_data(self, hass, config):
         """Test personal data storage and retrieval."""
         capability = KnowledgeGraphCapability(hass, config)
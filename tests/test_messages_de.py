@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import patch
-from multistage_assist.constants.messages_de import get_domain_confirmation
+from multistage_assist.constants.messages_de import _format_value_de, get_domain_confirmation
 
 def test_singular_confirmation():
     """Test that singular confirmation uses singular verb forms."""
@@ -32,3 +32,26 @@ def test_plural_confirmation():
         # Singular verbs should NOT appear in plural form
         assert " ist " not in msg
         assert " wurde " not in msg
+
+
+@pytest.mark.parametrize(
+    "value, domain, expected",
+    [
+        ("21.5", "climate", "21,5"),
+        ("20.0", "climate", "20"),
+        ("50.4", "light", "50"),
+        # Everything float() parses is still a number
+        ("1e3", "climate", "1000"),
+        ("2.5e-1", "climate", "0,25"),
+        ("1_000", "climate", "1000"),
+        # Text, including non-ASCII digits, stays text
+        ("step_up", "light", "step_up"),
+        ("1.5 Grad", "climate", "1,5 Grad"),
+        ("１２", "light", "１２"),
+        ("-inf", "climate", "-inf"),
+        (True, "switch", "True"),
+    ],
+)
+def test_format_value_de(value, domain, expected):
+    """Test German number formatting of confirmation values."""
+    assert _format_value_de(value, domain, "set") == expected
@@ -0,0 +1,42 @@
+"""Tests for PluralDetectionCapability fast paths."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from multistage_assist.capabilities.plural_detection import PluralDetectionCapability
+
+
+@pytest.fixture
+def plural():
+    cap = PluralDetectionCapability(MagicMock(), {})
+    cap._safe_prompt = AsyncMock(return_value={})
+    return cap
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Schalte alle Lichter aus", True),
+        ("Mach die Lampen an", True),
+        ("Mach das Licht an", False),
+        ("Schalte die Deckenlichter aus", True),
+        ("Mach die Stehlampe an", False),
+        ("Öffne die Terrassentüren", True),
+        ("Schalte allen Lichtern das Licht aus", True),
+        ("Mach das Licht in der Halle an", False),
+        ("Mach alle, bitte aus", True),
+        ("Sind alle? Dann aus", True),
+        ("Mach das Licht, bitte an", False),
+    ],
+)
+async def test_fast_paths_skip_llm(plural, text, expected):
+    result = await plural.run(MagicMock(text=text))
+
+    assert result == {"multiple_entities": expected}
+    plural._safe_prompt.assert_not_called()
+
+
+async def test_unknown_noun_falls_back_to_llm(plural):
+    await plural.run(MagicMock(text="Mach es gemütlich"))
+
+    plural._safe_prompt.assert_called_once()
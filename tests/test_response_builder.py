@@ -255,3 +255,17 @@ def test_normalize_for_tts_multiple_units():
     result = normalize_for_tts("Verbrauch: 5kWh bei 22°C")
     assert "Kilowattstunden" in result
     assert "Grad" in result
+
+
+def test_normalize_for_tts_leaves_words_with_unit_letters():
+    """Test normalize_for_tts only replaces units that follow a number."""
+    result = normalize_for_tts("Wohnzimmer A hat 22.5 °C")
+    assert result == "Wohnzimmer A hat 22,5 Grad Celsius"
+
+
+def test_normalize_for_tts_is_memoized():
+    """Test normalize_for_tts serves repeated phrases from its cache."""
+    normalize_for_tts.cache_clear()
+    normalize_for_tts("Bad ist 21.5°C")
+    normalize_for_tts("Bad ist 21.5°C")
+    assert normalize_for_tts.cache_info().hits == 1
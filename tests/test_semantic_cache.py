@@ -138,6 +138,97 @@ async def test_cache_stores_verified_command(semantic_cache, hass):
     assert entry.verified is True
 
 
+async def test_embeddings_matrix_is_kept_normalized(semantic_cache, hass):
+    """Test that stored rows are unit length so lookups only normalize the query."""
+    for text in ("Licht in der Küche an", "Rollladen im Büro hoch"):
+        await semantic_cache.store(
+            text=text, intent="HassTurnOn", entity_ids=["light.kuche"], slots={}, verified=True,
+        )
+
+    norms = np.linalg.norm(semantic_cache._embeddings_matrix, axis=1)
+    assert np.allclose(norms, 1.0, atol=1e-5)
+    assert semantic_cache._embeddings_matrix.dtype == np.float32
+
+    # Raw (unnormalized) stored embedding scaled up still scores ~1.0 against itself
+    raw = np.array(semantic_cache._cache[0].embedding, dtype=np.float32) * 7.0
+    sims = semantic_cache._cosine_similarity(raw, semantic_cache._embeddings_matrix)
+    assert sims[0] == pytest.approx(1.0, abs=1e-5)
+
+
+async def test_eviction_drops_least_recently_hit(semantic_cache, hass):
+    """Test that overflowing max_entries evicts the oldest entry and its matrix row."""
+    semantic_cache.max_entries = 2
+    texts = ["Licht in der Küche an", "Rollladen im Büro hoch", "Heizung im Bad aus"]
+    stored = []
+    for text in texts:
+        await semantic_cache.store(
+            text=text, intent="HassTurnOn", entity_ids=["light.kuche"], slots={}, verified=True,
+        )
+        # Make each entry strictly newer than the previous one
+        semantic_cache._cache[-1].last_hit = f"2024-01-0{len(stored) + 1}T00:00:00"
+        stored.append(semantic_cache._cache[-1].text)
+
+    assert [e.text for e in semantic_cache._cache] == stored[1:]
+    assert semantic_cache._embeddings_matrix.shape[0] == 2
+    expected = semantic_cache._normalize_rows(
+        np.array([e.embedding for e in semantic_cache._cache], dtype=np.float32)
+    )
+    assert np.allclose(semantic_cache._embeddings_matrix, expected)
+
+
+async def test_saves_are_coalesced(semantic_cache, hass):
+    """Test that several stores schedule one delayed write, flushed on shutdown."""
+    semantic_cache._save_cache = AsyncMock()
+    for text in ("Licht in der Küche an", "Rollladen im Büro hoch"):
+        await semantic_cache.store(
+            text=text, intent="HassTurnOn", entity_ids=["light.kuche"], slots={}, verified=True,
+        )
+
+    assert semantic_cache._save_handle is not None
+    semantic_cache._save_cache.assert_not_called()
+
+    await semantic_cache.async_shutdown()
+    semantic_cache._save_cache.assert_awaited_once()
+    assert semantic_cache._save_handle is None
+
+
+async def test_lookup_searches_two_word_queries(hass, config_entry):
+    """Test that short commands like 'Rollladen hoch' still reach the add-on lookup."""
+    cache = SemanticCacheCapability(hass, dict(config_entry.data))
+    cache._loaded = True
+    cache._get_session = MagicMock()
+    cache._get_session.return_value.post.side_effect = RuntimeError("offline")
+
+    assert await cache.lookup("Rollladen hoch") is None
+    cache._get_session.return_value.post.assert_called_once()
+
+
+async def test_query_embeddings_are_reused(hass, config_entry):
+    """Test that repeated query texts are served from the in-memory embedding LRU."""
+    cache = SemanticCacheCapability(hass, dict(config_entry.data))
+
+    resp = MagicMock(status=200)
+    resp.json = AsyncMock(return_value={"embedding": [0.1, 0.2, 0.3]})
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=resp)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    session = MagicMock()
+    session.post = MagicMock(return_value=ctx)
+    cache._get_session = MagicMock(return_value=session)
+
+    first = await cache._get_embedding("licht im bad an")
+    second = await cache._get_embedding(" licht im bad an ")
+    assert session.post.call_count == 1
+    assert second is first
+    assert not first.flags.writeable
+
+    with patch("multistage_assist.capabilities.semantic_cache.QUERY_EMBEDDING_CACHE_SIZE", 2):
+        await cache._get_embedding("rollladen hoch")
+        await cache._get_embedding("heizung aus")
+    assert "licht im bad an" not in cache._query_emb_cache
+    assert session.post.call_count == 3
+
+
 async def test_cache_not_stored_when_disabled(hass, config_entry):
     """Test that cache operations are skipped when disabled."""
     config = dict(config_entry.data)
@@ -387,7 +478,8 @@ async def test_stats_include_addon_info(semantic_cache, hass):
 async def test_lookup_preserves_query_casing(semantic_cache, hass):
     """Test that query casing is preserved for remote lookup."""
     # We patch the addon url post call since we want to check the JSON sent
-    with patch("aiohttp.ClientSession.post") as mock_post:
+    with patch.object(semantic_cache, "_get_session") as mock_session:
+        mock_post = mock_session.return_value.post
         # Mock successful response
         mock_resp = AsyncMock()
         mock_resp.status = 200
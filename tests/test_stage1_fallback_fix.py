@@ -50,7 +50,7 @@ async def test_stage1_fallback_entity_resolution():
     
     # Mock Memory
     mock_memory = AsyncMock()
-    mock_memory.get_area_alias.return_value = None
+    mock_memory.get_area_aliases.return_value = {}
 
     # Setup Processor
     processor = Stage1CacheProcessor(hass, config)
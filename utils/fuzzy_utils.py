@@ -12,6 +12,8 @@ _LOGGER = logging.getLogger(__name__)
 
 # Global cache for rapidfuzz.fuzz module
 _fuzz = None
+# rapidfuzz Levenshtein (C implementation), loaded together with _fuzz
+_levenshtein = None
 
 
 async def get_fuzz():
@@ -20,13 +22,17 @@ async def get_fuzz():
     Returns:
         rapidfuzz.fuzz module
     """
-    global _fuzz
+    global _fuzz, _levenshtein
     if _fuzz is not None:
         return _fuzz
 
     loop = asyncio.get_event_loop()
-    _fuzz = await loop.run_in_executor(
-        None, lambda: importlib.import_module("rapidfuzz.fuzz")
+    _fuzz, _levenshtein = await loop.run_in_executor(
+        None,
+        lambda: (
+            importlib.import_module("rapidfuzz.fuzz"),
+            importlib.import_module("rapidfuzz.distance.Levenshtein"),
+        ),
     )
     _LOGGER.debug("[FuzzyUtils] rapidfuzz.fuzz loaded")
     return _fuzz
@@ -151,29 +157,53 @@ def fuzzy_match(query: str, candidate: str) -> int:
 from .german_utils import GERMAN_ARTICLES, GERMAN_PREPOSITIONS, remove_articles_and_prepositions
 
 
-def levenshtein_distance(s1: str, s2: str) -> int:
+def levenshtein_distance(s1: str, s2: str, score_cutoff: Optional[int] = None) -> int:
     """Calculate Levenshtein edit distance between two strings.
     
     Args:
         s1: First string
         s2: Second string
+        score_cutoff: Optional maximum distance of interest; larger distances
+            are reported as score_cutoff + 1 (same contract as rapidfuzz)
         
     Returns:
         Minimum number of single-character edits (insert/delete/substitute)
     """
+    # Use rapidfuzz's C implementation once loaded (see get_fuzz)
+    if _levenshtein is not None:
+        return _levenshtein.distance(s1, s2, score_cutoff=score_cutoff)
+    
     if len(s1) > len(s2):
         s1, s2 = s2, s1
     
-    distances = range(len(s1) + 1)
+    # The length difference alone is a lower bound on the distance
+    if score_cutoff is not None and len(s2) - len(s1) > score_cutoff:
+        return score_cutoff + 1
+    
+    # Two preallocated rows, swapped per iteration instead of building a new list
+    distances = list(range(len(s1) + 1))
+    new_distances = [0] * (len(s1) + 1)
     for i2, c2 in enumerate(s2):
-        new_distances = [i2 + 1]
+        new_distances[0] = left = i2 + 1
         for i1, c1 in enumerate(s1):
             if c1 == c2:
-                new_distances.append(distances[i1])
+                left = distances[i1]
             else:
-                new_distances.append(1 + min(distances[i1], distances[i1 + 1], new_distances[-1]))
-        distances = new_distances
+                # 1 + min(substitute, delete, insert) without the min() call
+                cost = distances[i1]
+                if distances[i1 + 1] < cost:
+                    cost = distances[i1 + 1]
+                if left < cost:
+                    cost = left
+                left = cost + 1
+            new_distances[i1 + 1] = left
+        # Row minima never decrease, so once the whole row is past the cutoff we're done
+        if score_cutoff is not None and min(new_distances) > score_cutoff:
+            return score_cutoff + 1
+        distances, new_distances = new_distances, distances
     
+    if score_cutoff is not None and distances[-1] > score_cutoff:
+        return score_cutoff + 1
     return distances[-1]
 
 
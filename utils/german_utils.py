@@ -77,9 +77,12 @@ STATE_TRANSLATIONS: Dict[str, str] = {
 COMPOUND_SEPARATOR: str = " und "
 
 
+_UMLAUT_TABLE = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+
+
 def normalize_umlauts(text: str) -> str:
     """Normalize German umlauts and ß to ASCII equivalents."""
-    return text.replace("ä", "ae").replace("ö", "oe").replace("ü", "ue").replace("ß", "ss")
+    return text.translate(_UMLAUT_TABLE)
 
 
 def remove_articles_and_prepositions(text: str) -> str:
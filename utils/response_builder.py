@@ -5,6 +5,7 @@ entity lists, confirmation messages, questions, and error messages.
 """
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 
@@ -30,6 +31,8 @@ def join_names(names: List[str], conjunction: str = "und") -> str:
         return ""
     if len(names) == 1:
         return names[0]
+    if len(names) == 2:
+        return f"{names[0]} {conjunction} {names[1]}"
     return f"{', '.join(names[:-1])} {conjunction} {names[-1]}"
 
 
@@ -223,6 +226,10 @@ def build_state_response(
     # Get state translations for this domain
     state_map = STATE_DESCRIPTIONS_DE.get(domain, {})
     
+    # Single device (the common voice query): no grouping or joining needed
+    if len(device_names) == 1:
+        return f"{device_names[0]} ist {state_map.get(states[0], states[0])}."
+    
     # Group devices by state
     state_groups: Dict[str, List[str]] = {}
     for name, state in zip(device_names, states):
@@ -340,11 +347,23 @@ TTS_REPLACEMENTS = {
     "lm": " Lumen",
 }
 
+# Longest symbols first so "°C" wins over "°" and "kWh" over "kW"/"W".
+# Units only count directly after a number, so names like "Wohnzimmer" stay intact.
+_TTS_UNIT_RE = re.compile(
+    r"(?<=\d) ?("
+    + "|".join(re.escape(sym) for sym in sorted(TTS_REPLACEMENTS, key=len, reverse=True))
+    + r")(?!\w)"
+)
+_TTS_DECIMAL_RE = re.compile(r"(\d+)\.(\d+)")
+
 
+@lru_cache(maxsize=512)
 def normalize_for_tts(text: str) -> str:
     """Normalize text for text-to-speech.
     
     Converts symbols to spoken words and adjusts number formats.
+    Results are memoized (bounded) since state announcements repeat often;
+    use normalize_for_tts.cache_clear() to reset.
     
     Args:
         text: Input text
@@ -360,10 +379,7 @@ def normalize_for_tts(text: str) -> str:
         return ""
     
     # Convert decimal points to commas (German style)
-    text = re.sub(r"(\d+)\.(\d+)", r"\1,\2", text)
-    
-    # Replace symbols
-    for sym, spoken in TTS_REPLACEMENTS.items():
-        text = text.replace(sym, spoken)
+    text = _TTS_DECIMAL_RE.sub(r"\1,\2", text)
     
-    return text
+    # Replace unit symbols in a single scan
+    return _TTS_UNIT_RE.sub(lambda m: TTS_REPLACEMENTS[m.group(1)], text)
@@ -320,11 +320,14 @@ class SemanticCacheBuilder:
                 try:
                     exposed = async_should_expose(self.hass, "conversation", entity.entity_id)
                     if not exposed:
-                        _LOGGER.debug(f"[SemanticCache] Skipping {entity.entity_id} (Not exposed)")
+                        _LOGGER.debug("[SemanticCache] Skipping %s (Not exposed)", entity.entity_id)
                         continue
                 except Exception as e:
                     # Fallback: If we can't verify exposure, INCLUDE IT (Fail Open for old HA versions)
-                    _LOGGER.debug(f"[SemanticCache] Exposure check unavailable for {entity.entity_id}: {e}. Including.")
+                    _LOGGER.debug(
+                        "[SemanticCache] Exposure check unavailable for %s: %s. Including.",
+                        entity.entity_id, e,
+                    )
 
                 area_name = None
                 floor_name = None